@@ -1,10 +1,16 @@
 import streamlit as st
 import pandas as pd
-import gspread
-from google.oauth2.service_account import Credentials
 import altair as alt
 import json
-from mct_media_collector import collect_media_data  # ✅ our backend helper
+import threading
+import hashlib
+import numpy as np
+from mct_media_collector import store, THEME_LABELS, METRICS_LOG_PATH, get_feed_config, load_feed_state  # ✅ our backend helper
+from mct_theme_index import ThemeIndex, NO_THEME
+from mct_rollups import ALL_THEMES, build_rollups, period_start
+from mct_export import EXPORT_FORMATS, write_export
+from mct_collector_daemon import launch_background_run, is_collector_running, read_run_history
+from mct_metrics import read_metrics
 
 # ========================================
 # PAGE CONFIGURATION
@@ -114,27 +120,114 @@ st.markdown("<h4>from Social media and over 50 digital sources owned by Media Ho
 st.markdown("---")
 
 # ========================================
-# GOOGLE SHEET CONNECTION
+# DATA ACCESS (Cached store reads + one-time Google Sheet import)
 # ========================================
-GSHEET_JSON = st.secrets["GSHEET_JSON"]
-SCOPES = ["https://www.googleapis.com/auth/spreadsheets", "https://www.googleapis.com/auth/drive"]
-
-creds = Credentials.from_service_account_info(json.loads(GSHEET_JSON), scopes=SCOPES)
-client = gspread.authorize(creds)
-
 SHEET_URL = "https://docs.google.com/spreadsheets/d/1xUnrXB0tSG2EZhGr1WXsytKQu7KbudrjDhz1AHbjKGc"
-key = SHEET_URL.split("/d/")[1].split("/")[0]
-worksheet = client.open_by_key(key).worksheet("Results")
-data = worksheet.get_all_records()
-df = pd.DataFrame(data)
+DATA_TTL = 15 * 60  # seconds before the cached frame is rebuilt from scratch
+CATEGORY_COLUMNS = ["Platform", "Sentiment", "Media Sector Impact", "All Themes"]
+
+@st.cache_resource
+def get_gsheet_client():
+    GSHEET_JSON = st.secrets.get("GSHEET_JSON")
+    if not GSHEET_JSON:
+        return None
+    # Only needed for the one-time import, so kept off the startup path
+    import gspread
+    from google.oauth2.service_account import Credentials
+    SCOPES = ["https://www.googleapis.com/auth/spreadsheets", "https://www.googleapis.com/auth/drive"]
+    creds = Credentials.from_service_account_info(json.loads(GSHEET_JSON), scopes=SCOPES)
+    return gspread.authorize(creds)
+
+def import_sheet_into_store():
+    """Seed an empty local store from the Results sheet (first run only)."""
+    client = get_gsheet_client()
+    if client is None:
+        return 0
+    key = SHEET_URL.split("/d/")[1].split("/")[0]
+    worksheet = client.open_by_key(key).worksheet("Results")
+    return store.append(pd.DataFrame(worksheet.get_all_records()))
+
+@st.cache_resource(ttl=DATA_TTL)
+def get_data_cache():
+    # Shared by all sessions; only rows newer than last_id are read on reruns
+    return {"df": None, "themes": None, "last_id": 0, "revision": None, "lock": threading.Lock()}
+
+def load_data():
+    """Return (df, theme_index, data_version).
+
+    Dtypes and the multi-label theme index are built here, once per new batch of rows.
+    Everything is read again when stored rows were rewritten (store revision).
+    """
+    cache = get_data_cache()
+    with cache["lock"]:
+        revision = store.revision()
+        if revision != cache["revision"]:
+            cache.update(df=None, last_id=0, revision=revision)
+        new_rows, last_id = store.read_since(cache["last_id"])
+        if cache["df"] is None or not new_rows.empty:
+            df = new_rows if cache["df"] is None else pd.concat([cache["df"], new_rows], ignore_index=True)
+            for col in CATEGORY_COLUMNS:
+                df[col] = df[col].astype("category")
+            cache["df"], cache["last_id"] = df, last_id
+            cache["themes"] = ThemeIndex(df["All Themes"], THEME_LABELS)
+        return cache["df"], cache["themes"], (cache["last_id"], cache["revision"])
+
+def refresh_data():
+    get_data_cache.clear()
+    filter_options.clear()
+    search_matches.clear()
+    load_rollups.clear()
+
+@st.cache_data(max_entries=4)
+def filter_options(_df, version):
+    """Sidebar option lists and date bounds; recomputed only when the data version changes."""
+    options = {
+        col: ["All"] + sorted(_df[col].dropna().unique().tolist())
+        for col in ["Platform", "Sentiment", "Media Sector Impact"]
+    }
+    if _df["Date"].notnull().any():
+        options["date_bounds"] = (_df["Date"].min(), _df["Date"].max())
+    else:
+        options["date_bounds"] = (pd.Timestamp.today(), pd.Timestamp.today())
+    return options
+
+@st.cache_data(max_entries=16)
+def search_matches(_df, query, whole_words, version):
+    """Full-text search mapped onto df rows: (matched mask, relevance per row, ranked?)."""
+    results = store.search(query, prefix=not whole_words)
+    scores = results.set_index("Link")["Score"]
+    matched = _df["Link"].isin(scores.index).to_numpy()
+    relevance = _df["Link"].map(scores).to_numpy(dtype=float)
+    return matched, relevance, results.empty or bool(scores.notna().any())
+
+@st.cache_data(max_entries=4)
+def load_rollups(grain, version):
+    """Materialized day/week counts; their size follows days x categories, not rows."""
+    return store.read_rollups(grain)
+
+def select_rollups(rollups, start=None, end=None):
+    """Rollup rows matching the sidebar's platform / sentiment / impact / date filters."""
+    keep = np.ones(len(rollups), dtype=bool)
+    for col, value in (("Platform", selected_platform), ("Sentiment", selected_sentiment),
+                       ("Media Sector Impact", selected_sector)):
+        if value != "All":
+            keep &= (rollups[col] == value).to_numpy()
+    if start is not None:
+        keep &= (rollups["Period"] >= start).to_numpy()
+    if end is not None:
+        keep &= (rollups["Period"] <= end).to_numpy()
+    return rollups[keep]
+
+if store.count() == 0:
+    with st.spinner("Importing existing records from Google Sheets..."):
+        import_sheet_into_store()
+
+df, theme_index, data_version = load_data()
 
 if df.empty:
-    st.warning("No data found in your sheet yet.")
+    st.warning("No data collected yet — run the collector to get started.")
     st.stop()
 
-# Ensure Date column is proper datetime
-if "Date" in df.columns:
-    df["Date"] = pd.to_datetime(df["Date"], errors="coerce")
     # LOGO
 st.sidebar.image("MCTLOGO.png", width=60)
 
@@ -143,106 +236,185 @@ st.sidebar.image("MCTLOGO.png", width=60)
 # ========================================
 st.sidebar.header("⚙️ Search Settings")
 
-platforms = ["All"] + sorted(df["Platform"].dropna().unique().tolist())
-sentiments = ["All"] + sorted(df["Sentiment"].dropna().unique().tolist())
-themes = ["All"] + sorted(df["All Themes"].dropna().unique().tolist())
-media_sectors = ["All"] + sorted(df["Media Sector Impact"].dropna().unique().tolist())
+search_query = st.sidebar.text_input(
+    "🔎 Search articles",
+    placeholder='e.g. "kufungiwa gazeti" uchaguzi',
+    help='Words must all appear; "quoted words" must appear together; OR between words matches either.',
+).strip()
+whole_words = st.sidebar.checkbox(
+    "Whole words only", value=False,
+    help="Off: words also match longer forms (gazeti → gazetini)",
+)
+
+options = filter_options(df, data_version)
+platforms = options["Platform"]
+sentiments = options["Sentiment"]
+media_sectors = options["Media Sector Impact"]
 
 selected_platform = st.sidebar.selectbox("Platform", platforms)
 selected_sentiment = st.sidebar.selectbox("Sentiment", sentiments)
-selected_theme = st.sidebar.selectbox("Theme", themes)
+selected_themes = st.sidebar.multiselect("Themes", theme_index.labels)
+theme_mode = st.sidebar.radio("Match", ["Any of", "All of"], horizontal=True,
+                              disabled=len(selected_themes) < 2)
 selected_sector = st.sidebar.selectbox("Media Sector Impact", media_sectors)
 
-# Date range filter — handle missing or invalid dates safely
-if df["Date"].notnull().any():
-    min_date = df["Date"].min()
-    max_date = df["Date"].max()
-else:
-    min_date = pd.Timestamp.today()
-    max_date = pd.Timestamp.today()
+# Date range filter — bounds are precomputed; missing dates fall back to today
+min_date, max_date = options["date_bounds"]
 
 selected_dates = st.sidebar.date_input(
     "Date Range",
     [min_date, max_date],
     min_value=min_date,
     max_value=max_date,
+    help="Publish dates in UTC",
+)
+include_imputed = st.sidebar.checkbox(
+    "Include articles without a publish date", value=True,
+    help="Their date is the time the collector fetched them",
 )
 
 # -------------------------------
 # Apply dynamic filtering
 # -------------------------------
-filtered = df.copy()
+# One positional mask over the cached df (never modified); the theme index
+# shares its row order, so theme filters and counts use the same mask
+mask = np.ones(len(df), dtype=bool)
 
 if selected_platform != "All":
-    filtered = filtered[filtered["Platform"] == selected_platform]
+    mask &= (df["Platform"] == selected_platform).to_numpy()
 
 if selected_sentiment != "All":
-    filtered = filtered[filtered["Sentiment"] == selected_sentiment]
+    mask &= (df["Sentiment"] == selected_sentiment).to_numpy()
 
-if selected_theme != "All":
-    filtered = filtered[filtered["All Themes"] == selected_theme]
+if selected_themes:
+    mask &= theme_index.rows_matching(selected_themes, mode="all" if theme_mode == "All of" else "any")
 
 if selected_sector != "All":
-    filtered = filtered[filtered["Media Sector Impact"] == selected_sector]
+    mask &= (df["Media Sector Impact"] == selected_sector).to_numpy()
 
-if isinstance(selected_dates, list) and len(selected_dates) == 2:
+start_date = end_date = None
+if isinstance(selected_dates, (list, tuple)) and len(selected_dates) == 2:
     start_date, end_date = selected_dates
-    filtered = filtered[
-        (filtered["Date"] >= pd.to_datetime(start_date))
-        & (filtered["Date"] <= pd.to_datetime(end_date))
-    ]
-
-# Collector Button
+    mask &= (
+        (df["Date"] >= pd.to_datetime(start_date))
+        & (df["Date"] < pd.to_datetime(end_date) + pd.Timedelta(days=1))  # whole end day
+    ).to_numpy()
+
+if not include_imputed:
+    mask &= ~df["Date Imputed"].to_numpy()
+
+relevance, ranked = None, False
+if search_query:
+    matched, relevance, ranked = search_matches(df, search_query, whole_words, data_version)
+    mask &= matched
+
+# Positions of the matching articles in the cached df; rows are only
+# materialized a page or an export chunk at a time
+rows = np.flatnonzero(mask)
+theme_counts = theme_index.counts(mask)
+if search_query:
+    st.caption(f"🔎 {len(rows):,} articles match “{search_query}”"
+               + ("" if ranked else " — too many to rank by relevance"))
+
+# Collector Button — runs happen in a separate process (mct_collector_daemon.py)
 st.sidebar.markdown("---")
-if st.sidebar.button("🔄 Run Collector Now"):
-    with st.spinner("Collecting latest media data..."):
-        result = collect_media_data()
-        st.success(f" Collector finished — {result}")
-        st.stop()
+collector_running = is_collector_running()
+if st.sidebar.button("🔄 Run Collector Now", disabled=collector_running):
+    launch_background_run(trigger="dashboard")
+    st.sidebar.info("Collector started in the background — refresh data when it finishes.")
+if st.sidebar.button("♻️ Refresh Data"):
+    refresh_data()
+    st.rerun()
+
+last_runs = read_run_history(limit=5)
+if collector_running:
+    st.sidebar.caption("⏳ A collection is running…")
+if last_runs:
+    last = last_runs[0]
+    st.sidebar.caption(f"Last run: {last.get('finished_at', last['started_at'])} — {last['status']}")
+    with st.sidebar.expander("Recent runs"):
+        st.dataframe(pd.DataFrame(last_runs)[["started_at", "trigger", "status", "duration", "result"]],
+                     use_container_width=True, hide_index=True)
 
 # ========================================
 # METRICS
 # ========================================
 col1, col2, col3 = st.columns(3)
-col1.metric(" Articles", len(filtered))
-col2.metric(" Platforms", filtered["Platform"].nunique())
-col3.metric(" Themes", filtered["All Themes"].nunique())
+col1.metric(" Articles", len(rows))
+col2.metric(" Platforms", df["Platform"].iloc[rows].nunique())
+col3.metric(" Themes", int((theme_counts > 0).sum()))
 st.markdown("---")
 
 # ========================================
 # CHARTS
 # ========================================
+# Charts draw from day/week rollups, so what reaches the browser is a few
+# hundred counts however large the archive. Theme selections, search and
+# hiding undated articles are not in the rollups; then the filtered rows
+# are rolled up on the fly into the same small shape.
 alt.themes.enable("dark")
+SENTIMENT_SCALE = alt.Scale(domain=["Positive", "Neutral", "Negative"], range=["#22c55e", "#facc15", "#ef4444"])
+
+trend_grain = st.radio("Trend interval", ["day", "week"], horizontal=True, format_func=str.title)
+start_ts = pd.Timestamp(start_date) if start_date else None
+end_ts = pd.Timestamp(end_date) if end_date else None
+from_rows = bool(selected_themes or search_query or not include_imputed)
+if from_rows:
+    day_counts = build_rollups(df.iloc[rows], grains=("day",))
+else:
+    day_counts = select_rollups(load_rollups("day", data_version), start_ts, end_ts)
+
+whole_archive = (start_ts is None or start_ts <= min_date.normalize()) and (
+    end_ts is None or end_ts >= max_date.normalize())
+if trend_grain == "day":
+    trend_counts = day_counts
+elif whole_archive and not from_rows:
+    trend_counts = select_rollups(load_rollups("week", data_version))
+else:
+    # A partial range cuts the edge weeks, so weeks are summed from days
+    trend_counts = day_counts.assign(Period=period_start(day_counts["Period"], "week"))
+
+article_counts = day_counts[day_counts["Theme"] == ALL_THEMES]
+theme_rows = day_counts[~day_counts["Theme"].isin([ALL_THEMES, NO_THEME])]
 
 st.subheader("📊 Number of Articles by Sentiment")
-if not filtered.empty:
+if len(rows):
+    sentiment_counts = article_counts.groupby("Sentiment", as_index=False)["Articles"].sum()
     sentiment_chart = (
-        alt.Chart(filtered)
+        alt.Chart(sentiment_counts)
         .mark_bar()
         .encode(
             x=alt.X("Sentiment:N", title="Sentiment"),
-            y=alt.Y("count()", title="Number of Articles"),
-            color=alt.Color(
-                "Sentiment:N",
-                scale=alt.Scale(
-                    domain=["Positive", "Neutral", "Negative"],
-                    range=["#22c55e", "#facc15", "#ef4444"]
-                )
-            )
+            y=alt.Y("Articles:Q", title="Number of Articles"),
+            color=alt.Color("Sentiment:N", scale=SENTIMENT_SCALE)
         )
         .properties(height=300)
     )
     st.altair_chart(sentiment_chart, use_container_width=True)
 
-    st.subheader(" Themes Distribution")
-    theme_counts = (
-        filtered["All Themes"]
-        .value_counts()
-        .reset_index()
-        .rename(columns={"index": "Theme", "All Themes": "Count"})
+    st.subheader("📈 Articles over Time by Sentiment")
+    sentiment_trend = (
+        trend_counts[trend_counts["Theme"] == ALL_THEMES]
+        .groupby(["Period", "Sentiment"], as_index=False)["Articles"].sum()
+    )
+    st.altair_chart(
+        alt.Chart(sentiment_trend)
+        .mark_line(point=True)
+        .encode(
+            x=alt.X("Period:T", title=trend_grain.title()),
+            y=alt.Y("Articles:Q", title="Articles"),
+            color=alt.Color("Sentiment:N", scale=SENTIMENT_SCALE),
+            tooltip=["Period:T", "Sentiment:N", "Articles:Q"],
+        )
+        .properties(height=300),
+        use_container_width=True,
     )
+
+    st.subheader(" Themes Distribution")
+    # Articles with several themes count once under each of them
+    theme_distribution = theme_rows.groupby("Theme", as_index=False)["Articles"].sum().rename(columns={"Articles": "Count"})
     theme_chart = (
-        alt.Chart(theme_counts)
+        alt.Chart(theme_distribution)
         .mark_bar()
         .encode(
             x=alt.X("Theme:N", sort="-y", title="Theme"),
@@ -252,6 +424,24 @@ if not filtered.empty:
         .properties(height=300)
     )
     st.altair_chart(theme_chart, use_container_width=True)
+
+    st.subheader("📈 Themes over Time")
+    theme_trend = (
+        trend_counts[~trend_counts["Theme"].isin([ALL_THEMES, NO_THEME])]
+        .groupby(["Period", "Theme"], as_index=False)["Articles"].sum()
+    )
+    st.altair_chart(
+        alt.Chart(theme_trend)
+        .mark_line(point=True)
+        .encode(
+            x=alt.X("Period:T", title=trend_grain.title()),
+            y=alt.Y("Articles:Q", title="Articles"),
+            color=alt.Color("Theme:N"),
+            tooltip=["Period:T", "Theme:N", "Articles:Q"],
+        )
+        .properties(height=300),
+        use_container_width=True,
+    )
 else:
     st.info("No data matches the selected filters.")
 st.markdown("---")
@@ -259,12 +449,146 @@ st.markdown("---")
 # ========================================
 # TABLE + DOWNLOAD
 # ========================================
+# Only the current page is sent to the browser; sorting works on the
+# matching positions, so it never copies the filtered rows
+TABLE_COLUMNS = ["Platform", "Date", "All Themes", "Sentiment", "Media Sector Impact", "Link"]
+SORTABLE_COLUMNS = ["Date", "Platform", "Sentiment", "Media Sector Impact", "All Themes"]
+
+def sort_rows(rows, sort_by, descending):
+    if sort_by == "Relevance":
+        keys = relevance[rows]
+    elif sort_by == "Date":
+        keys = df["Date"].to_numpy()[rows]
+    else:
+        keys = df[sort_by].cat.codes.to_numpy()[rows]  # categories are sorted A-Z
+    order = rows[np.argsort(keys, kind="stable")]
+    return order[::-1] if descending else order
+
+@st.fragment
+def export_section(rows, selection_key):
+    """Exports are built only when asked for, chunk by chunk, and kept per selection."""
+    fmt = st.radio("Export format", list(EXPORT_FORMATS), horizontal=True,
+                   format_func=lambda f: EXPORT_FORMATS[f][0])
+    label, extension, mime = EXPORT_FORMATS[fmt]
+    export = st.session_state.get("export")
+    if export is None or export["key"] != (selection_key, fmt):
+        export = None
+        if st.button(f"📦 Prepare {label} export ({len(rows):,} rows)", disabled=not len(rows)):
+            with st.spinner("Writing export..."):
+                path = write_export(df, rows, fmt)
+            export = st.session_state["export"] = {"key": (selection_key, fmt), "path": path}
+    if export is not None:
+        with open(export["path"], "rb") as f:
+            st.download_button(f" Download {label}", f, f"mct_data{extension}", mime)
+
 st.subheader(" Detailed Records")
-cols = [c for c in ["Platform", "Date", "All Themes", "Sentiment", "Media Sector Impact", "Link"] if c in filtered.columns]
-st.dataframe(filtered[cols], use_container_width=True, height=500)
+if len(rows):
+    sort_options = (["Relevance"] if ranked else []) + SORTABLE_COLUMNS
+    c1, c2, c3, c4 = st.columns([2, 1, 1, 1])
+    sort_by = c1.selectbox("Sort by", sort_options)
+    descending = c2.selectbox("Order", ["Descending", "Ascending"]) == "Descending"
+    page_size = c3.selectbox("Rows per page", [50, 100, 250, 500], index=1)
+    page_count = -(-len(rows) // page_size)
+    page = c4.number_input(f"Page (of {page_count:,})", min_value=1, max_value=page_count, value=1)
+
+    first = (page - 1) * page_size
+    page_rows = sort_rows(rows, sort_by, descending)[first:first + page_size]
+    page_df = df.iloc[page_rows][TABLE_COLUMNS]
+    if ranked:
+        page_df.insert(0, "Relevance", relevance[page_rows])
+    st.dataframe(page_df, use_container_width=True, hide_index=True,
+                 height=min(500, 38 + 35 * len(page_df)))
+    st.caption(f"Rows {first + 1:,}–{first + len(page_df):,} of {len(rows):,}")
+
+export_section(rows, (data_version, hashlib.blake2b(rows.tobytes(), digest_size=16).hexdigest()))
+
+st.markdown("---")
 
-csv = filtered.to_csv(index=False).encode("utf-8")
-st.download_button(" Download CSV", csv, "mct_data.csv", "text/csv")
+# ========================================
+# COLLECTOR HEALTH (metrics.jsonl written by every collector run)
+# ========================================
+@st.cache_data(ttl=60)
+def load_run_metrics(limit=50):
+    return read_metrics(METRICS_LOG_PATH, limit)
+
+def run_summary(run):
+    counters = run.get("counters", {})
+    lookups = counters.get("ai.cache_hits", 0) + counters.get("ai.cache_misses", 0)
+    return {
+        "Started": pd.to_datetime(run["started_at"]),
+        "Status": run.get("status", ""),
+        "Duration (s)": run.get("duration", 0.0),
+        "Articles": counters.get("articles.stored", 0),
+        "AI requests": counters.get("ai.requests", 0),
+        "AI retries": counters.get("ai.retries", 0),
+        "AI tokens": counters.get("ai.prompt_tokens", 0) + counters.get("ai.completion_tokens", 0),
+        "Cache hit rate": counters.get("ai.cache_hits", 0) / lookups if lookups else None,
+        "Sheets calls": counters.get("sheets.calls", 0),
+        "Sheets rows": counters.get("sheets.rows_appended", 0),
+    }
+
+st.subheader("🩺 Collector health")
+runs = load_run_metrics()
+if not runs:
+    st.info("No collector runs recorded yet.")
+else:
+    last = runs[0]
+    summary = run_summary(last)
+    st.caption(f"Last run {last['started_at']} — {summary['Status']}: {last.get('result') or ''}")
+    k1, k2, k3, k4, k5, k6 = st.columns(6)
+    k1.metric("Duration", f"{summary['Duration (s)']:.1f}s")
+    k2.metric("Articles stored", summary["Articles"])
+    k3.metric("AI requests", summary["AI requests"], f"{summary['AI retries']} retries", delta_color="inverse")
+    k4.metric("AI tokens", f"{summary['AI tokens']:,}")
+    k5.metric("Cache hit rate", "—" if summary["Cache hit rate"] is None else f"{summary['Cache hit rate']:.0%}")
+    k6.metric("Sheets calls", summary["Sheets calls"], f"{summary['Sheets rows']:,} rows", delta_color="off")
+
+    left, right = st.columns(2)
+    with left:
+        st.markdown("**Stage timings (last run)**")
+        stages = pd.DataFrame(list(last.get("stages", {}).items()), columns=["Stage", "Seconds"])
+        if stages.empty:
+            st.caption("No stages timed.")
+        else:
+            st.altair_chart(alt.Chart(stages).mark_bar().encode(
+                x="Seconds:Q", y=alt.Y("Stage:N", sort="-x"), tooltip=["Stage", "Seconds"],
+            ), use_container_width=True)
+    with right:
+        st.markdown("**Slowest and failing feeds (last run)**")
+        feeds = pd.DataFrame(last.get("feeds", []))
+        if feeds.empty:
+            st.caption("No feeds fetched.")
+        else:
+            feeds["failed"] = feeds["error"].notna()
+            feeds = feeds.sort_values(["failed", "latency"], ascending=False).head(15)
+            st.dataframe(feeds[["source", "status", "latency", "entries", "new_entries", "error"]],
+                         use_container_width=True, hide_index=True)
+
+    with st.expander("Feed polling schedule"):
+        feed_state = load_feed_state()
+        schedule = pd.DataFrame([
+            {
+                "Feed": feed_state.get(f["url"], {}).get("title", f["url"]),
+                "Items / day": round(24 * s["rate"], 1) if s.get("rate") is not None else None,
+                "Interval (min)": s.get("interval"),
+                "Next poll": s.get("next_poll"),
+                "Failures": s.get("failures", 0),
+            }
+            for f in get_feed_config()
+            for s in [feed_state.get(f["url"], {}).get("schedule", {})]
+        ])
+        if not schedule.empty:
+            st.dataframe(schedule.sort_values("Interval (min)"), use_container_width=True, hide_index=True)
+
+    history = pd.DataFrame([run_summary(r) for r in runs])
+    if len(history) > 1:
+        st.markdown("**Per-run trends**")
+        t1, t2 = st.columns(2)
+        for col, measure in ((t1, "Duration (s)"), (t2, "AI tokens")):
+            col.altair_chart(alt.Chart(history).mark_line(point=True).encode(
+                x=alt.X("Started:T", title=None), y=f"{measure}:Q",
+                tooltip=["Started:T", "Status", measure],
+            ), use_container_width=True)
 
 st.success(" Dashboard styled successfully — Professional Analytics Mode Active")
 
@@ -0,0 +1,196 @@
+# ===============================================
+# 🟣 MCT Media Monitoring — Batched AI Classifier
+# (JSON batches + RPM/TPM limiter + backoff)
+# ===============================================
+
+import json
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+AI_THEMES = [
+    "Media Freedom",
+    "Journalist Safety",
+    "Media Economy",
+    "Violations & Complaints",
+    "Political Bias",
+    "Public Sentiment",
+    "Social & Human Rights Issues",
+    "Analytics & AI Monitoring",
+]
+
+_THEME_LOOKUP = {t.casefold(): t for t in AI_THEMES}
+
+BATCH_PROMPT = """
+You are an assistant for media monitoring in Tanzania.
+Classify each article below into zero or more of these themes:
+{themes}
+Reply with a JSON object of the form {{"results": {{"<article id>": ["<theme>", ...]}}}}
+with one key for every article id, using the theme names exactly as written.
+Use an empty list when no theme applies.
+Articles (JSON):
+{articles}
+"""
+
+
+def estimate_tokens(text):
+    """Rough token count (~4 characters per token) used for TPM budgeting."""
+    return max(1, len(str(text)) // 4)
+
+
+class RateLimiter:
+    """Blocking sliding-window limiter for requests and tokens per minute."""
+
+    def __init__(self, requests_per_minute, tokens_per_minute, window=60.0):
+        self.rpm = requests_per_minute
+        self.tpm = tokens_per_minute
+        self.window = window
+        self._events = deque()  # (timestamp, tokens)
+        self._tokens = 0
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while self._events and now - self._events[0][0] >= self.window:
+                    self._tokens -= self._events.popleft()[1]
+                fits_requests = len(self._events) < self.rpm
+                # An oversized request is let through once the window is empty
+                fits_tokens = self._tokens + tokens <= self.tpm or not self._events
+                if fits_requests and fits_tokens:
+                    self._events.append((now, tokens))
+                    self._tokens += tokens
+                    return
+                wait = self.window - (now - self._events[0][0])
+            time.sleep(max(wait, 0.01))
+
+
+class BatchClassifier:
+    """Classify many articles with few, concurrent chat.completions calls.
+
+    Articles are looked up in ``cache`` first; the rest are packed into
+    batches of up to ``batch_size`` articles / ``max_batch_tokens`` tokens,
+    sent concurrently on ``max_workers`` threads under the rate limiter, and
+    retried with exponential backoff. Any OpenAI-compatible client works,
+    including one pointed at the local mock server in mct_mock_openai.py.
+    Usage (requests, tokens, retries, cache hits) goes to ``metrics``, a
+    mct_metrics.RunMetrics, when one is given.
+    """
+
+    def __init__(self, client, model, prompt_version, cache=None, batch_size=10,
+                 max_batch_tokens=6000, max_workers=4, requests_per_minute=500,
+                 tokens_per_minute=200_000, max_retries=5, base_delay=1.0,
+                 max_delay=30.0, max_chars=4000, metrics=None):
+        # Retries happen in _classify_batch (with backoff and metrics), so the
+        # OpenAI client's own retries are switched off to not multiply them
+        self.client = client.with_options(max_retries=0) if hasattr(client, "with_options") else client
+        self.model = model
+        self.prompt_version = prompt_version
+        self.cache = cache
+        self.batch_size = batch_size
+        self.max_batch_tokens = max_batch_tokens
+        self.max_workers = max_workers
+        self.limiter = RateLimiter(requests_per_minute, tokens_per_minute)
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_chars = max_chars
+        self.metrics = metrics
+
+    def _incr(self, name, value=1):
+        if self.metrics is not None:
+            self.metrics.incr(name, value)
+
+    def classify(self, texts):
+        """Classify {article_id: text}; returns {article_id: [themes]}."""
+        results = {}
+        pending = {}
+        for article_id, text in texts.items():
+            cached = self.cache.get(text, self.model, self.prompt_version) if self.cache else None
+            if cached is not None:
+                results[article_id] = cached
+            else:
+                pending[str(article_id)] = (article_id, str(text)[:self.max_chars])
+        self._incr("ai.cache_hits", len(results))
+        self._incr("ai.cache_misses", len(pending))
+
+        batches = self._make_batches(pending)
+        if batches:
+            workers = max(1, min(self.max_workers, len(batches)))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                for batch, answers in zip(batches, pool.map(self._classify_batch, batches)):
+                    for key in batch:
+                        article_id, text = pending[key]
+                        if answers is None or key not in answers:
+                            # Failed or skipped: not cached, retried next run
+                            results[article_id] = []
+                            self._incr("ai.unanswered")
+                            continue
+                        results[article_id] = answers[key]
+                        if self.cache:
+                            self.cache.set(texts[article_id], self.model, self.prompt_version, answers[key])
+        return results
+
+    def _make_batches(self, pending):
+        batches, current, current_tokens = [], {}, 0
+        for key, (_, text) in pending.items():
+            tokens = estimate_tokens(text)
+            if current and (len(current) >= self.batch_size or current_tokens + tokens > self.max_batch_tokens):
+                batches.append(current)
+                current, current_tokens = {}, 0
+            current[key] = text
+            current_tokens += tokens
+        if current:
+            batches.append(current)
+        return batches
+
+    def _classify_batch(self, batch):
+        prompt = BATCH_PROMPT.format(
+            themes="\n".join(f"{i}. {t}" for i, t in enumerate(AI_THEMES, 1)),
+            articles=json.dumps([{"id": k, "text": v} for k, v in batch.items()], ensure_ascii=False),
+        )
+        # Prompt plus a generous allowance for the JSON answer
+        tokens = estimate_tokens(prompt) + 30 * len(batch)
+
+        for attempt in range(self.max_retries):
+            self.limiter.acquire(tokens)
+            self._incr("ai.requests")
+            if attempt:
+                self._incr("ai.retries")
+            try:
+                resp = self.client.chat.completions.create(
+                    model=self.model,
+                    messages=[{"role": "user", "content": prompt}],
+                    temperature=0,
+                    response_format={"type": "json_object"},
+                )
+                usage = getattr(resp, "usage", None)
+                if usage is not None:
+                    self._incr("ai.prompt_tokens", usage.prompt_tokens or 0)
+                    self._incr("ai.completion_tokens", usage.completion_tokens or 0)
+                return self._parse(resp.choices[0].message.content)
+            except Exception as e:
+                self._incr("ai.errors")
+                if attempt == self.max_retries - 1:
+                    print(f"⚠️ AI batch of {len(batch)} failed (attempt {attempt+1}), giving up:", e)
+                    break
+                delay = min(self.max_delay, self.base_delay * 2 ** attempt) * (0.5 + random.random())
+                print(f"⚠️ AI batch of {len(batch)} failed (attempt {attempt+1}), retrying in {delay:.1f}s:", e)
+                time.sleep(delay)
+        self._incr("ai.failed_batches")
+        return None
+
+    @staticmethod
+    def _parse(content):
+        data = json.loads(content)
+        raw = data.get("results", data) if isinstance(data, dict) else {}
+        answers = {}
+        for key, themes in raw.items():
+            if isinstance(themes, str):
+                themes = themes.split(",")
+            canonical = [_THEME_LOOKUP.get(str(t).strip().casefold()) for t in themes or []]
+            answers[str(key)] = [t for t in dict.fromkeys(canonical) if t]
+        return answers
@@ -0,0 +1,116 @@
+# ===============================================
+# 🟣 MCT Media Monitoring — Persistent AI Cache
+# (SQLite, content-hash keys, TTL + LRU eviction)
+# ===============================================
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+
+
+def normalize_content(text):
+    """Canonical form used for hashing: NFKC, casefolded, single spaces."""
+    text = unicodedata.normalize("NFKC", str(text)).casefold()
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def content_key(text, model, prompt_version):
+    digest = hashlib.sha256(normalize_content(text).encode("utf-8")).hexdigest()
+    return f"{model}:{prompt_version}:{digest}"
+
+
+class AICache:
+    """On-disk cache of AI theme classifications.
+
+    Entries are keyed by a hash of the normalized article text plus the model
+    and prompt version, so changing either one invalidates old answers.
+    Expired entries (older than ``ttl_seconds``) are dropped, and once the
+    cache grows past ``max_entries`` the least recently used rows go first.
+    """
+
+    def __init__(self, path, ttl_seconds=90 * 24 * 3600, max_entries=200_000):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._writes = 0
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS ai_cache (
+                    key TEXT PRIMARY KEY,
+                    result TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_used REAL NOT NULL
+                )
+            """)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS ai_cache_last_used ON ai_cache(last_used)")
+            self._conn.commit()
+        return self._conn
+
+    def get(self, text, model, prompt_version):
+        key = content_key(text, model, prompt_version)
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT result, created_at FROM ai_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or now - row[1] > self.ttl_seconds:
+                self.misses += 1
+                return None
+            conn.execute("UPDATE ai_cache SET last_used = ? WHERE key = ?", (now, key))
+            conn.commit()
+            self.hits += 1
+            return json.loads(row[0])
+
+    def set(self, text, model, prompt_version, result):
+        key = content_key(text, model, prompt_version)
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO ai_cache (key, result, created_at, last_used) VALUES (?, ?, ?, ?)",
+                (key, json.dumps(result, ensure_ascii=False), now, now),
+            )
+            self._writes += 1
+            if self._writes % 100 == 1:
+                self._evict(conn, now)
+            conn.commit()
+
+    def _evict(self, conn, now):
+        conn.execute("DELETE FROM ai_cache WHERE created_at < ?", (now - self.ttl_seconds,))
+        (count,) = conn.execute("SELECT COUNT(*) FROM ai_cache").fetchone()
+        if count > self.max_entries:
+            conn.execute(
+                "DELETE FROM ai_cache WHERE key IN "
+                "(SELECT key FROM ai_cache ORDER BY last_used ASC LIMIT ?)",
+                (count - self.max_entries,),
+            )
+
+    def stats(self, since=None):
+        """Hits, misses and hit rate (only those after ``since``, an earlier
+        stats() result, when given) plus the current number of entries."""
+        with self._lock:
+            (size,) = self._connect().execute("SELECT COUNT(*) FROM ai_cache").fetchone()
+        hits = self.hits - (since["hits"] if since else 0)
+        misses = self.misses - (since["misses"] if since else 0)
+        lookups = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+            "entries": size,
+        }
@@ -0,0 +1,392 @@
+# ===============================================
+# 🟣 MCT Media Monitoring — Bulk Backfill
+# (historical JSONL / CSV dumps and saved feed snapshots into the store)
+# ===============================================
+#
+# Usage:
+#   python mct_backfill.py archive_2023.jsonl archive_2024.csv snapshots/*.xml
+#   python mct_backfill.py dump.jsonl --workers 8 --chunk-size 5000
+#   python mct_backfill.py dump.jsonl --ai-budget 5000 # at most 5000 articles sent to OpenAI
+#   python mct_backfill.py dump.jsonl --no-ai          # no OpenAI calls during the backfill
+#   python mct_backfill.py dump.jsonl --restart        # ignore the checkpoint
+#
+# Input files are read a chunk at a time. Cleaning, keyword themes and
+# confidence, relevance, sentiment and MinHash run on a process pool; dedup, AI tagging and the
+# store write run one chunk at a time on a single thread fed by a bounded
+# queue, so at most --max-pending + --ai-queue chunks are held in memory.
+# After every stored chunk the position in each file is checkpointed, and an
+# interrupted backfill picks up where it stopped.
+#
+# Articles left for the AI by --no-ai or a spent --ai-budget are stored as
+# "unreviewed". The AI work is deferred, not skipped: later collector runs
+# review them with whatever remains of the daily AI budget.
+#
+# JSONL / CSV records may use the store's columns (Platform, Content, Link,
+# Date) or feed-style fields (source, title, summary/description, link/url,
+# published/updated).
+
+import argparse
+import csv
+import json
+import os
+import queue
+import signal
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+import feedparser
+import pandas as pd
+
+import mct_media_collector as collector
+from mct_collector_daemon import CollectorLock
+from mct_dedup import band_keys, minhash
+from mct_metrics import append_metrics
+from mct_store import DATE_FORMAT, normalize_dates
+
+BACKFILL_STATE_PATH = os.path.join(collector.DATA_DIR, "backfill_state.json")
+CHUNK_SIZE = 5000  # records per chunk
+AI_QUEUE_SIZE = 2  # prepared chunks waiting for dedup / AI / store
+SNAPSHOT_EXTENSIONS = (".xml", ".rss", ".atom", ".rdf")
+
+# Field names tried, in order, for each store column
+FIELD_ALIASES = {
+    "Platform": ["Platform", "platform", "source", "feed_title"],
+    "Title": ["title"],
+    "Body": ["Content", "content", "summary", "description", "text"],
+    "Link": ["Link", "link", "url", "id"],
+    "Date": ["Date", "date", "published", "updated", "pubDate"],
+}
+
+
+# =====================================================
+# 1️⃣ READING INPUT IN CHUNKS
+# =====================================================
+
+def _field(record, name):
+    for key in FIELD_ALIASES[name]:
+        value = record.get(key)
+        if value is not None and value == value and str(value).strip():  # skips NaN
+            return str(value)
+    return ""
+
+
+def normalize_record(record, default_platform):
+    """Store-shaped dict (Content still raw HTML) from one dump record."""
+    title, body = _field(record, "Title"), _field(record, "Body")
+    return {
+        "Platform": _field(record, "Platform") or default_platform,
+        "Title": title,
+        "Content": f"{title} {body}" if title and title not in body else body or title,
+        "Link": _field(record, "Link").strip(),
+        "Date": _field(record, "Date") or None,
+    }
+
+
+def _snapshot_records(path):
+    feed = feedparser.parse(path)
+    source = feed.feed.get("title", os.path.basename(path))
+    for entry in feed.entries:
+        ts = collector.entry_timestamp(entry)
+        yield {
+            "source": source,
+            "title": entry.get("title", ""),
+            "summary": entry.get("summary", ""),
+            "link": entry.get("link", ""),
+            # feedparser's parsed time is UTC; fall back to the raw string
+            "published": (
+                time.strftime("%Y-%m-%d %H:%M:%S+00:00", time.gmtime(ts)) if ts is not None
+                else entry.get("published") or entry.get("updated")
+            ),
+        }
+
+
+def iter_records(path, skip=0):
+    """Raw records of one input file, starting after the first ``skip``.
+
+    JSONL lines come back unparsed; the pool workers parse them.
+    """
+    lower = path.lower()
+    if lower.endswith((".jsonl", ".ndjson")):
+        with open(path, encoding="utf-8") as f:
+            position = 0
+            for line in f:
+                if not line.strip():
+                    continue
+                position += 1
+                if position > skip:
+                    yield line
+    elif lower.endswith(".csv"):
+        with open(path, encoding="utf-8", newline="") as f:
+            for position, row in enumerate(csv.DictReader(f), 1):
+                if position > skip:
+                    yield row
+    elif lower.endswith(SNAPSHOT_EXTENSIONS):
+        for position, record in enumerate(_snapshot_records(path), 1):
+            if position > skip:
+                yield record
+    else:
+        raise ValueError(f"❌ Unsupported input file '{path}' (use .jsonl, .csv or a feed .xml)")
+
+
+def iter_chunks(path, chunk_size=CHUNK_SIZE, skip=0):
+    """(records, position) per chunk; position counts input records read so far."""
+    chunk, position = [], skip
+    for record in iter_records(path, skip):
+        position += 1
+        chunk.append(record)
+        if len(chunk) >= chunk_size:
+            yield chunk, position
+            chunk = []
+    if chunk:
+        yield chunk, position
+
+
+# =====================================================
+# 2️⃣ CPU STAGES (run in worker processes)
+# =====================================================
+
+def _init_worker():
+    # Ctrl-C is handled by the main process, which lets the writer finish
+    # the queued chunks and checkpoint them
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def prepare_chunk(records, platform, imputed_at):
+    """Parse, clean, keyword-tag, score sentiment and fingerprint one chunk.
+
+    Runs in a pool worker; everything here is pure CPU work on the chunk
+    itself, so chunks are independent. ``platform`` names records that
+    carry no source of their own.
+    """
+    records = [
+        normalize_record(json.loads(r) if isinstance(r, str) else r, platform) for r in records
+    ]
+    df = pd.DataFrame(records, columns=["Platform", "Title", "Content", "Link", "Date"])
+    df = df[df["Link"] != ""].reset_index(drop=True)
+    df["Content"] = collector.clean_html_batch(df["Content"].tolist())
+    # Title only counts for keyword scoring when it leads the Content
+    df["Title"] = collector.clean_html_batch(df["Title"].tolist())
+    df.loc[[not c.startswith(t) for c, t in zip(df["Content"], df["Title"])], "Title"] = ""
+    dates = normalize_dates(df["Date"])
+    df["Date Imputed"] = dates.isna().to_numpy()
+    df["Date"] = dates.fillna(imputed_at).to_numpy()
+    df["Theme Mask"], df["Keyword Confidence"] = collector.score_keywords(df)
+    df["Relevance"] = collector.relevance_scores(df["Content"], train=False)
+    df["Sentiment"] = collector.detect_sentiment_batch(df["Content"])
+    df["MinHash"] = df["Content"].map(minhash)
+    df["MinHash Bands"] = df["MinHash"].map(band_keys)
+    return df
+
+
+# =====================================================
+# 3️⃣ CHECKPOINTS
+# =====================================================
+
+def load_state(path=BACKFILL_STATE_PATH):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_state(state, path=BACKFILL_STATE_PATH):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(state, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+def file_signature(path):
+    st = os.stat(path)
+    return {"size": st.st_size, "mtime": int(st.st_mtime)}
+
+
+def resume_position(state, path):
+    """Records of ``path`` already stored, or None when the file is finished.
+
+    A file that changed since its checkpoint is read again from the start;
+    links already stored are skipped by dedup, so nothing is stored twice.
+    """
+    entry = state.get(path)
+    if not entry or {k: entry.get(k) for k in ("size", "mtime")} != file_signature(path):
+        return 0
+    return None if entry.get("done") else entry.get("position", 0)
+
+
+# =====================================================
+# 4️⃣ DEDUP + AI + STORE (single writer thread)
+# =====================================================
+
+class Backfill:
+    """Streams input files through the process pool into the store.
+
+    The main thread reads chunks and keeps up to ``max_pending`` of them in
+    the pool. Finished chunks go, in input order, onto a queue of
+    ``ai_queue_size`` that one writer thread drains: dedup, AI for articles
+    with no keyword theme, store write, checkpoint. A full queue blocks the
+    reader, so a slow AI stage throttles the pipeline instead of filling memory.
+    """
+
+    def __init__(self, workers=None, chunk_size=CHUNK_SIZE, max_pending=None,
+                 ai_queue_size=AI_QUEUE_SIZE, ai_budget=None, state_path=BACKFILL_STATE_PATH):
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.max_pending = max_pending or self.workers * 2
+        self.ai_budget = ai_budget  # articles this backfill may send to the AI; None = no cap
+        self.state_path = state_path
+        self.state = {}
+        self.queue = queue.Queue(maxsize=ai_queue_size)
+        self.error = None
+        self.totals = {"records": 0, "stored": 0, "duplicates": 0, "ai": 0}
+
+    # -- writer thread --------------------------------------------------
+    def _writer(self):
+        while True:
+            item = self.queue.get()
+            if item is None:
+                return
+            if self.error is not None:
+                continue  # drain so the reader never blocks on a dead writer
+            try:
+                self._write(*item)
+            except BaseException as e:
+                self.error = e
+
+    def _write(self, path, position, df):
+        if df is not None:
+            started = time.perf_counter()
+            stored = self.store_chunk(df)
+            rate = len(df) / max(time.perf_counter() - started, 1e-9)
+            print(f"📦 {os.path.basename(path)}: {position:,} records read, "
+                  f"{stored:,} stored ({rate:,.0f} rows/s in the writer)")
+        entry = self.state.setdefault(path, {})
+        entry.update(file_signature(path))
+        entry["position"] = position
+        entry["done"] = df is None  # None marks the end of the file
+        entry["updated_at"] = datetime.now().strftime(DATE_FORMAT)
+        save_state(self.state, self.state_path)
+
+    def store_chunk(self, df):
+        """Dedup, AI-tag and store one prepared chunk; returns rows inserted."""
+        metrics = collector.run_metrics
+        with metrics.stage("dedup"):
+            unique, duplicates = collector.dedup_articles(df)
+
+        budget = None if self.ai_budget is None else self.ai_budget - self.totals["ai"]
+        sent = metrics.count("ai.cache_misses")  # cached answers do not use the budget
+        unique = collector.escalate_themes(
+            unique, unique["Theme Mask"], unique["Keyword Confidence"], unique["Relevance"], budget=budget,
+        )
+        self.totals["ai"] += metrics.count("ai.cache_misses") - sent
+
+        out = pd.concat([unique, collector.inherit_enrichment(duplicates, unique)], ignore_index=True)
+        out["Collected At"] = datetime.now().strftime(DATE_FORMAT)
+        with metrics.stage("store"):
+            stored = collector.store.append(out)
+            collector.seen_index.add(out)
+        self.totals["stored"] += stored
+        self.totals["duplicates"] += len(duplicates)
+        metrics.incr("articles.stored", stored)
+        metrics.incr("articles.duplicates", len(duplicates))
+        return stored
+
+    # -- reader / pool ----------------------------------------------------
+    def _hand_off(self, path, position, future):
+        df = future.result() if future is not None else None
+        while True:
+            if self.error is not None:
+                raise self.error
+            try:
+                self.queue.put((path, position, df), timeout=1)
+                return
+            except queue.Full:
+                continue
+
+    def run(self, paths, restart=False):
+        """Backfill ``paths`` in order; returns the totals dict."""
+        self.state = {} if restart else load_state(self.state_path)
+        imputed_at = pd.Timestamp.now(tz="UTC").tz_localize(None).floor("s")
+        collector.get_relevance_model()  # (re)trained here once, not in every worker
+        writer = threading.Thread(target=self._writer, name="backfill-writer", daemon=True)
+        writer.start()
+        pending = deque()
+        try:
+            with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker) as pool:
+                for path in paths:
+                    path = os.path.abspath(path)
+                    skip = resume_position(self.state, path)
+                    if skip is None:
+                        print(f"⏭️ {os.path.basename(path)} already backfilled")
+                        continue
+                    if skip:
+                        print(f"↩️ Resuming {os.path.basename(path)} after record {skip:,}")
+                    platform = os.path.splitext(os.path.basename(path))[0]
+                    position = skip
+                    for records, position in iter_chunks(path, self.chunk_size, skip):
+                        self.totals["records"] += len(records)
+                        collector.run_metrics.incr("articles.fetched", len(records))
+                        pending.append((path, position, pool.submit(prepare_chunk, records, platform, imputed_at)))
+                        while len(pending) >= self.max_pending:
+                            self._hand_off(*pending.popleft())
+                    pending.append((path, position, None))  # end of file, checkpointed in order
+                while pending:
+                    self._hand_off(*pending.popleft())
+        finally:
+            self.queue.put(None)
+            writer.join()
+        if self.error is not None:
+            raise self.error
+        return self.totals
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Backfill historical articles into the local store")
+    parser.add_argument("paths", nargs="+", help=".jsonl / .csv dumps or saved feed .xml snapshots")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="records per chunk")
+    parser.add_argument("--max-pending", type=int, default=None, help="chunks in the pool at once (default: 2 x workers)")
+    parser.add_argument("--ai-queue", type=int, default=AI_QUEUE_SIZE, help="prepared chunks waiting for AI / store")
+    parser.add_argument("--ai-budget", type=int, default=None, help="most articles to send to OpenAI (default: no cap)")
+    parser.add_argument("--no-ai", action="store_true", help="no OpenAI calls now; uncertain articles are left to later collector runs")
+    parser.add_argument("--restart", action="store_true", help="ignore the checkpoint and read every file again")
+    args = parser.parse_args()
+
+    # Shares the collector's lock: a scheduled run never writes while a backfill does
+    lock = CollectorLock()
+    if not lock.acquire():
+        sys.exit("⏭️ A collection or backfill is already running.")
+
+    backfill = Backfill(args.workers, args.chunk_size, args.max_pending, args.ai_queue,
+                        ai_budget=0 if args.no_ai else args.ai_budget)
+    collector.run_metrics.reset()
+    cache_before = collector.ai_cache.stats()
+    started = time.perf_counter()
+    status, result = "error", None
+    try:
+        totals = backfill.run(args.paths, restart=args.restart)
+        seconds = time.perf_counter() - started
+        status = "ok"
+        result = (f"✅ Backfilled {totals['records']:,} records: {totals['stored']:,} stored, "
+                  f"{totals['duplicates']:,} near-duplicates, {totals['ai']:,} sent to AI "
+                  f"({totals['records'] / max(seconds, 1e-9):,.0f} records/s)")
+        print(result)
+    except KeyboardInterrupt:
+        result = "Interrupted; run again to resume from the checkpoint."
+        print(f"⏸️ {result}")
+    except Exception as e:
+        result = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        lock.release()
+        append_metrics(collector.METRICS_LOG_PATH, collector.run_metrics.snapshot(
+            status=status, result=result, trigger="backfill", ai_cache=collector.ai_cache.stats(since=cache_before)))
+
+
+if __name__ == "__main__":
+    main()
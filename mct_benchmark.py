@@ -0,0 +1,486 @@
+# ===============================================
+# 🟣 MCT Media Monitoring — Benchmarks
+# (synthetic corpora, legacy vs current stages)
+# ===============================================
+#
+# Usage:
+#   python mct_benchmark.py enrichment --sizes 10000 100000 --json bench.json
+#   python mct_benchmark.py clean --sizes 10000
+#   python mct_benchmark.py pipeline --json bench.json --compare bench_previous.json
+#
+# "pipeline" runs every collector stage offline: feeds come from
+# mct_mock_feeds, AI from mct_mock_openai and the Sheets mirror from
+# mct_mock_sheets, so results only depend on the code under test.
+
+import argparse
+import contextlib
+import json
+import os
+import random
+import re
+import subprocess
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+from bs4 import BeautifulSoup
+
+import mct_media_collector as collector
+from mct_ai_batch import AI_THEMES
+from mct_scheduler import SCHEDULE_DEFAULTS
+
+FILLER_WORDS = (
+    "serikali wananchi leo rais mkutano mji biashara kilimo afya elimu shule "
+    "the government said on monday that officials police football club match "
+    "music festival weather rain dar es salaam dodoma arusha zanzibar"
+).split()
+
+ENGLISH_HINTS = ["journalist", "election", "press freedom", "corruption", "advertising", "citizens"]
+
+
+def synthetic_articles(n, seed=42):
+    """Articles mixing filler words with theme phrases; ~1/3 have no keyword hit."""
+    rng = random.Random(seed)
+    phrases = [kw for kws in collector.THEME_KEYWORDS.values() for kw in kws]
+    contents = []
+    for i in range(n):
+        words = [rng.choice(FILLER_WORDS) for _ in range(rng.randint(20, 60))]
+        kind = i % 3
+        if kind == 0:
+            for _ in range(rng.randint(1, 3)):
+                words.insert(rng.randrange(len(words)), rng.choice(phrases))
+        elif kind == 1:
+            words.insert(rng.randrange(len(words)), rng.choice(ENGLISH_HINTS))
+        contents.append(" ".join(words))
+    return pd.DataFrame({
+        "Platform": [f"Source {i % 20}" for i in range(n)],
+        "Content": contents,
+        "Link": [f"https://example.tz/article/{i}" for i in range(n)],
+        "Date": "2025-10-01 08:00:00",
+    })
+
+
+def offline_ai(texts):
+    """Cheap deterministic stand-in for ai_classify_themes_batch, so the
+    enrichment benchmark measures the pandas work rather than the AI stub."""
+    return {
+        article_id: [AI_THEMES[len(text) % len(AI_THEMES)]] if len(text) % 3 else []
+        for article_id, text in texts.items()
+    }
+
+
+# Title + summary strings shaped like what the feeds actually send
+HTML_FIXTURES = [
+    "Rais Samia azindua mradi wa maji Dodoma",
+    "Serikali yatoa tamko kuhusu  uhuru wa habari\n\t leo",
+    "<p>Rais Samia&nbsp;amesema serikali itaendelea kulinda uhuru wa vyombo vya habari&#8230;</p>"
+    "<p>The post <a href=\"https://millardayo.com/x\" rel=\"nofollow\">Rais Samia</a> appeared first on "
+    "<a href=\"https://millardayo.com\" rel=\"nofollow\">millardayo.com</a>.</p>",
+    "<img width=\"300\" height=\"200\" src=\"https://dar24.com/a.jpg\" class=\"wp-post-image\" alt=\"Mkutano > wa\" />"
+    "Wananchi wa Arusha wamelalamikia ukosefu wa maji safi",
+    "<div class=\"field-item\"><strong>DAR ES SALAAM:</strong> Journalists &amp; editors met on Monday "
+    "to discuss the Media Services Act &ndash; a law critics say restricts press freedom.</div>",
+    "AT&amp;T, Vodacom &amp; Airtel &lt;b&gt;announce&lt;/b&gt; new tariffs &#8217;24",
+    "<![CDATA[Habari za uchaguzi: tume yatangaza ratiba]]>",
+    "<figure><img src=\"x.jpg\"/><figcaption>Picha: Maktaba</figcaption></figure>Mwandishi wa habari akamatwa",
+    "<script type=\"text/javascript\">var x = \"<p>ad</p>\";</script>Mechi ya Simba na Yanga <!-- ad slot --> yaahirishwa",
+    "<style>.a{color:red}</style><ul><li>Kwanza</li><li>Pili</li></ul>",
+    "Bei ya mafuta: 5 < 6 na 7 > 3 kwa mujibu wa EWURA",
+    "<p>Unclosed paragraph <b>with bold",
+    "Tanzania&#39;s &quot;Media Council&quot; (MCT) releases annual report",
+]
+
+
+def legacy_clean_html(text):
+    """clean_html as it was before the regex engine (reference output)."""
+    clean = BeautifulSoup(str(text), "html.parser").get_text()
+    clean = re.sub(r"\s+", " ", clean)
+    return clean.strip()
+
+
+def html_corpus(n, seed=7):
+    rng = random.Random(seed)
+    return [
+        " ".join(rng.choice(HTML_FIXTURES) for _ in range(rng.randint(1, 3))) + f" #{i}"
+        for i in range(n)
+    ]
+
+
+def bench_clean(sizes):
+    results = []
+    for n in sizes:
+        corpus = html_corpus(n)
+        legacy, legacy_s = _timed(lambda texts: [legacy_clean_html(t) for t in texts], corpus)
+        current, current_s = _timed(lambda texts: [collector.clean_html(t) for t in texts], corpus)
+        batch, batch_s = _timed(collector.clean_html_batch, corpus)
+
+        mismatches = sorted({(t, a, b) for t, a, b in zip(corpus, legacy, current) if a != b})
+        row = {
+            "stage": "clean",
+            "articles": n,
+            "legacy_seconds": round(legacy_s, 3),
+            "current_seconds": round(current_s, 3),
+            "batch_seconds": round(batch_s, 3),
+            "speedup": round(legacy_s / current_s, 1) if current_s else None,
+            "match_rate": round(1 - sum(a != b for a, b in zip(legacy, current)) / n, 4),
+            "batch_consistent": batch == current,
+        }
+        print(f"⏱️ clean n={n}: legacy {row['legacy_seconds']}s, current {row['current_seconds']}s "
+              f"({row['speedup']}x), match rate {row['match_rate']:.2%}")
+        for text, a, b in mismatches[:3]:
+            print(f"   ≠ {text[:80]!r}\n     legacy:  {a[:80]!r}\n     current: {b[:80]!r}")
+        results.append(row)
+    return results
+
+
+SWAHILI_SENTIMENT_FIXTURES = [
+    "Wananchi wamefurahi sana na mafanikio ya mradi wa maji",
+    "Mwandishi wa habari amekamatwa na polisi, hofu yatanda",
+    "Wachezaji hawakufurahi baada ya kushindwa mechi",
+    "Serikali yapongezwa kwa kuboresha huduma za afya",
+    "Ajali mbaya yasababisha vifo vya watu watano",
+    "Hakuna furaha kwa wakazi wa Kigoma baada ya mafuriko",
+    "Tuzo za waandishi bora zatolewa jijini Arusha",
+    "Ufisadi na rushwa vyalalamikiwa na wananchi",
+]
+
+# Neutral sports / economy coverage whose nouns share verb stems
+# (mashindano, ushindani: shind-; msaidizi: saidi-); these should stay Neutral
+SWAHILI_NEUTRAL_FIXTURES = [
+    "Mashindano ya riadha yataanza Jumamosi jijini Dodoma",
+    "Ushindani wa bei ya mafuta kati ya kampuni mbili",
+    "Msaidizi wa kocha atangaza kikosi cha timu ya taifa",
+    "Washindani kumi wameingia hatua ya nusu fainali ya mashindano",
+    "Wasaidizi wa rais wakutana na wawekezaji wa sekta ya kilimo",
+]
+
+
+def bench_sentiment(sizes):
+    from mct_sentiment import get_sentiment_engine
+    textblob = get_sentiment_engine("textblob")
+    results = []
+    for n in sizes:
+        texts = synthetic_articles(n)["Content"].tolist()
+        lexicon = get_sentiment_engine("lexicon")  # fresh, so its cache starts empty
+        _, legacy_s = _timed(textblob.score_batch, texts)
+        _, current_s = _timed(lexicon.score_batch, texts)
+        _, cached_s = _timed(lexicon.score_batch, texts)
+
+        sw_legacy = textblob.label_batch(SWAHILI_SENTIMENT_FIXTURES)
+        sw_current = lexicon.label_batch(SWAHILI_SENTIMENT_FIXTURES)
+        neutral_current = lexicon.label_batch(SWAHILI_NEUTRAL_FIXTURES)
+        row = {
+            "stage": "sentiment",
+            "articles": n,
+            "legacy_seconds": round(legacy_s, 3),
+            "current_seconds": round(current_s, 3),
+            "cached_seconds": round(cached_s, 3),
+            "speedup": round(legacy_s / current_s, 1) if current_s else None,
+            "swahili_non_neutral_legacy": sum(l != "Neutral" for l in sw_legacy) / len(sw_legacy),
+            "swahili_non_neutral_current": sum(l != "Neutral" for l in sw_current) / len(sw_current),
+            "swahili_neutral_mislabelled": sum(l != "Neutral" for l in neutral_current) / len(neutral_current),
+        }
+        print(f"⏱️ sentiment n={n}: textblob {row['legacy_seconds']}s, lexicon {row['current_seconds']}s "
+              f"({row['speedup']}x, cached {row['cached_seconds']}s); Swahili fixtures non-neutral "
+              f"{row['swahili_non_neutral_legacy']:.0%} → {row['swahili_non_neutral_current']:.0%}, "
+              f"neutral fixtures mislabelled {row['swahili_neutral_mislabelled']:.0%}")
+        results.append(row)
+    return results
+
+
+def legacy_enrich_themes(df, classify_ai):
+    """The row-wise enrichment stage as it was before the bitmask rewrite."""
+    df = df.copy()
+    df["Detected Themes"] = df["Content"].apply(collector.detect_themes)
+    df["AI Themes"] = df.apply(
+        lambda r: classify_ai({0: r["Content"]})[0] if not r["Detected Themes"] else [], axis=1
+    )
+    df["All Themes"] = df.apply(
+        lambda r: ", ".join(set(r["Detected Themes"] + r["AI Themes"])) if (r["Detected Themes"] or r["AI Themes"]) else "—",
+        axis=1
+    )
+    df["Media Sector Impact"] = df.apply(collector.determine_media_impact, axis=1)
+    return df
+
+
+def cold_start_enrich_themes(df, classify_ai):
+    """The tiered enrichment before a relevance model exists, with no AI budget.
+
+    This must match the legacy rule: only articles without keyword hits go
+    to the AI.
+    """
+    masks, confidence = collector.score_keywords(df)
+    return collector.escalate_themes(
+        df, masks, confidence, relevance=np.full(len(df), np.nan), classify_ai=classify_ai
+    )
+
+
+def counting(classify_ai):
+    """Wrap classify_ai; the returned list holds the number of articles it was given."""
+    sent = [0]
+
+    def classify(texts):
+        sent[0] += len(texts)
+        return classify_ai(texts)
+    return classify, sent
+
+
+def _timed(fn, *args):
+    started = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - started
+
+
+def bench_enrichment(sizes):
+    results = []
+    for n in sizes:
+        df = synthetic_articles(n)
+        legacy_ai, legacy_sent = counting(offline_ai)
+        current_ai, current_sent = counting(offline_ai)
+        legacy, legacy_s = _timed(legacy_enrich_themes, df, legacy_ai)
+        current, current_s = _timed(cold_start_enrich_themes, df, current_ai)
+
+        # The legacy join order came from a set, so compare theme sets
+        same_themes = (
+            legacy["All Themes"].map(lambda s: frozenset(s.split(", ")))
+            == current["All Themes"].map(lambda s: frozenset(s.split(", ")))
+        ).all()
+        same_impact = (legacy["Media Sector Impact"] == current["Media Sector Impact"]).all()
+
+        row = {
+            "stage": "enrichment",
+            "articles": n,
+            "legacy_seconds": round(legacy_s, 3),
+            "current_seconds": round(current_s, 3),
+            "speedup": round(legacy_s / current_s, 1) if current_s else None,
+            "identical_output": bool(same_themes and same_impact),
+            "legacy_ai_articles": legacy_sent[0],
+            "current_ai_articles": current_sent[0],
+        }
+        print(f"⏱️ enrichment n={n}: legacy {row['legacy_seconds']}s, "
+              f"current {row['current_seconds']}s ({row['speedup']}x), identical={row['identical_output']}, "
+              f"AI articles {row['legacy_ai_articles']} → {row['current_ai_articles']} (cold start)")
+        if row["current_ai_articles"] > row["legacy_ai_articles"]:
+            raise RuntimeError("Cold-start tiering sends more articles to the AI than the legacy rule")
+        results.append(row)
+    return results
+
+
+@contextlib.contextmanager
+def offline_collector(data_dir, feed_urls, ai_base_url, ai_workers):
+    """Point the collector at a scratch data dir, the mock feeds and the mock AI.
+
+    Everything patched here is put back on exit.
+    """
+    from openai import OpenAI
+    from mct_ai_cache import AICache
+    from mct_dedup import SeenIndex
+    from mct_store import MediaStore
+
+    patched = {
+        "get_feed_config": lambda: [{**SCHEDULE_DEFAULTS, "url": url} for url in feed_urls],
+        "FEED_STATE_PATH": os.path.join(data_dir, "feed_state.json"),
+        "METRICS_LOG_PATH": os.path.join(data_dir, "metrics.jsonl"),
+        "AI_BUDGET_PATH": os.path.join(data_dir, "ai_budget.json"),
+        "RELEVANCE_MODEL_PATH": os.path.join(data_dir, "relevance_model.npz"),
+        "store": MediaStore(os.path.join(data_dir, "media_store.sqlite3")),
+        "seen_index": SeenIndex(os.path.join(data_dir, "seen_index.sqlite3")),
+        "ai_cache": AICache(os.path.join(data_dir, "ai_cache.sqlite3"), collector.AI_CACHE_TTL),
+        "AI_MAX_WORKERS": ai_workers,
+        # The mock has no quota; the limiter would otherwise set the pace
+        "AI_REQUESTS_PER_MINUTE": 10**9,
+        "AI_TOKENS_PER_MINUTE": 10**12,
+        # Measure the AI stage at full volume, not capped by the daily budget
+        "AI_DAILY_BUDGET": None,
+    }
+    saved = {name: getattr(collector, name) for name in patched}
+    saved_clients = dict(collector._clients)
+    for name, value in patched.items():
+        setattr(collector, name, value)
+    collector._clients.clear()
+    collector._clients["openai"] = OpenAI(api_key="offline", base_url=ai_base_url)
+    try:
+        yield
+    finally:
+        for name, value in saved.items():
+            setattr(collector, name, value)
+        collector._clients.clear()
+        collector._clients.update(saved_clients)
+
+
+def _stage(seconds, articles):
+    return {
+        "seconds": round(seconds, 3),
+        "articles_per_second": round(articles / seconds, 1) if seconds else None,
+    }
+
+
+def _revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, timeout=5,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def run_pipeline_stages(sheets_client):
+    """fetch → clean → dedup → themes → AI → sentiment → store → upload, each timed.
+
+    Same order as collect_media_data; cleaning and AI run inside fetch_rss and
+    enrich_themes, so their time is measured separately and subtracted.
+    """
+    timings = {"clean": 0.0, "ai": 0.0}
+    ai_articles = 0
+    clean_html_batch = collector.clean_html_batch
+
+    def timed_clean(texts):
+        result, seconds = _timed(clean_html_batch, texts)
+        timings["clean"] += seconds
+        return result
+
+    def timed_ai(texts):
+        nonlocal ai_articles
+        ai_articles += len(texts)
+        result, seconds = _timed(collector.ai_classify_themes_batch, texts)
+        timings["ai"] += seconds
+        return result
+
+    collector.clean_html_batch = timed_clean
+    try:
+        (df, feed_state), fetch_s = _timed(collector.fetch_rss)
+    finally:
+        collector.clean_html_batch = clean_html_batch
+    fetched = len(df)
+
+    (df, duplicates), dedup_s = _timed(collector.dedup_articles, df)
+    enriched, themes_s = _timed(collector.enrich_themes, df, timed_ai)
+    sentiment, sentiment_s = _timed(collector.detect_sentiment_batch, enriched["Content"])
+    enriched["Sentiment"] = sentiment
+    enriched = pd.concat([enriched, collector.inherit_enrichment(duplicates, enriched)], ignore_index=True)
+    enriched["Collected At"] = "2025-10-01 12:00:00"
+
+    def store_rows(frame):
+        stored = collector.store.append(frame)
+        collector.seen_index.add(frame)
+        return stored
+
+    _, store_s = _timed(store_rows, enriched)
+    _, upload_s = _timed(
+        collector.upload_to_gsheet, enriched[collector.RESULT_COLUMNS], "Results",
+        sheets_client, "https://docs.google.com/spreadsheets/d/offline-benchmark/edit",
+    )
+
+    latencies = [s["latency"] for s in feed_state.values() if s.get("latency") is not None]
+    stages = {
+        "fetch": _stage(fetch_s - timings["clean"], fetched),
+        "clean": _stage(timings["clean"], fetched),
+        "dedup": _stage(dedup_s, fetched),
+        "themes": _stage(themes_s - timings["ai"], len(df)),
+        "ai": _stage(timings["ai"], ai_articles),
+        "sentiment": _stage(sentiment_s, len(df)),
+        "store": _stage(store_s, len(enriched)),
+        "upload": _stage(upload_s, len(enriched)),
+    }
+    details = {
+        "feeds": len(feed_state),
+        "feed_errors": sum(bool(s.get("error")) for s in feed_state.values()),
+        "feed_latency_p50": round(float(np.percentile(latencies, 50)), 3) if latencies else None,
+        "feed_latency_p95": round(float(np.percentile(latencies, 95)), 3) if latencies else None,
+        "ai_articles": ai_articles,
+        "sheets_calls": sheets_client.calls(),
+    }
+    return fetched, stages, details
+
+
+def bench_pipeline(sizes, items_per_feed=500, feed_latency=0.05, ai_latency=0.02,
+                   ai_workers=collector.AI_MAX_WORKERS, sheets_latency=0.1):
+    from mct_mock_feeds import start_mock_feeds
+    from mct_mock_openai import start_mock_openai
+    from mct_mock_sheets import FakeSheetsClient
+
+    ai_server, ai_base_url = start_mock_openai(latency=ai_latency)
+    revision = _revision()
+    results = []
+    try:
+        for n in sizes:
+            feeds = max(1, -(-n // items_per_feed))
+            feed_server, urls = start_mock_feeds(feeds, -(-n // feeds), feed_latency)
+            calls_before = ai_server.RequestHandlerClass.calls
+            sheets = FakeSheetsClient(latency=sheets_latency)
+            try:
+                with tempfile.TemporaryDirectory() as data_dir, \
+                        offline_collector(data_dir, urls, ai_base_url, ai_workers):
+                    started = time.perf_counter()
+                    fetched, stages, details = run_pipeline_stages(sheets)
+                    total_s = time.perf_counter() - started
+            finally:
+                feed_server.shutdown()
+            details["ai_requests"] = ai_server.RequestHandlerClass.calls - calls_before
+
+            row = {
+                "stage": "pipeline",
+                "articles": fetched,
+                "revision": revision,
+                "total_seconds": round(total_s, 3),
+                "stages": stages,
+                "settings": {"items_per_feed": items_per_feed, "feed_latency": feed_latency,
+                             "ai_latency": ai_latency, "ai_workers": ai_workers,
+                             "sheets_latency": sheets_latency},
+                **details,
+            }
+            print(f"⏱️ pipeline n={fetched}: {row['total_seconds']}s total over {details['feeds']} feeds "
+                  f"(p95 {details['feed_latency_p95']}s), {details['ai_requests']} AI requests")
+            for name, stage in stages.items():
+                print(f"   {name:<9} {stage['seconds']:>8}s  {stage['articles_per_second'] or '-':>10} articles/s")
+            results.append(row)
+    finally:
+        ai_server.shutdown()
+    return results
+
+
+def compare_results(results, baseline):
+    """Print per-stage time ratios against an earlier JSON run (same stage and size)."""
+    previous = {(r["stage"], r["articles"]): r for r in baseline}
+    for row in results:
+        before = previous.get((row["stage"], row["articles"]))
+        if before is None:
+            continue
+        if "stages" in row:
+            pairs = [(name, s["seconds"], before.get("stages", {}).get(name, {}).get("seconds"))
+                     for name, s in row["stages"].items()]
+        else:
+            pairs = [("current", row.get("current_seconds"), before.get("current_seconds"))]
+        print(f"📊 {row['stage']} n={row['articles']} vs {before.get('revision') or 'baseline'}:")
+        for name, now, then in pairs:
+            if now is not None and then:
+                flag = "🔺" if now > then * 1.2 else "✅"
+                print(f"   {flag} {name:<9} {then}s → {now}s ({now / then:.2f}x)")
+
+
+BENCHMARKS = {
+    "clean": bench_clean,
+    "enrichment": bench_enrichment,
+    "pipeline": bench_pipeline,
+    "sentiment": bench_sentiment,
+}
+DEFAULT_SIZES = {"pipeline": [1_000, 10_000, 100_000]}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="MCT collector benchmarks")
+    parser.add_argument("benchmark", choices=sorted(BENCHMARKS))
+    parser.add_argument("--sizes", type=int, nargs="+", help="articles per run (default 10k/100k, pipeline 1k/10k/100k)")
+    parser.add_argument("--json", help="write results to this JSON file")
+    parser.add_argument("--compare", help="earlier --json output to compare against")
+    args = parser.parse_args()
+
+    sizes = args.sizes or DEFAULT_SIZES.get(args.benchmark, [10_000, 100_000])
+    results = BENCHMARKS[args.benchmark](sizes)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            compare_results(results, json.load(f))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
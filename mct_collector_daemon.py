@@ -0,0 +1,187 @@
+# ===============================================
+# 🟣 MCT Media Monitoring — Headless Collector
+# (CLI / scheduled daemon + run lock + run history)
+# ===============================================
+#
+# Usage:
+#   python mct_collector_daemon.py --once                # poll every feed once (cron-friendly)
+#   python mct_collector_daemon.py                       # adaptive schedule, feeds polled when due
+#   python mct_collector_daemon.py --once --force-refresh
+#
+# In daemon mode each feed has its own polling interval, learned from how
+# often it publishes (see mct_scheduler.py and feeds.json). The daemon wakes
+# for the earliest due feed and polls only the feeds that are due.
+#
+# Secrets come from .streamlit/secrets.toml or environment variables
+# (OPENAI_API_KEY, GSHEET_JSON, RESULTS_SHEET_URL).
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+import traceback
+from datetime import datetime
+
+from mct_scheduler import due_feeds, load_feeds_config, next_due_ts
+
+try:
+    import fcntl
+except ImportError:  # Windows: fall back to an exclusive lock file
+    fcntl = None
+
+DATA_DIR = os.environ.get("MCT_DATA_DIR", "mct_data")  # same default as mct_media_collector
+LOCK_PATH = os.path.join(DATA_DIR, "collector.lock")
+RUN_HISTORY_PATH = os.path.join(DATA_DIR, "run_history.jsonl")
+FEED_STATE_PATH = os.path.join(DATA_DIR, "feed_state.json")  # written by the collector
+MIN_SLEEP = 30  # seconds between scheduler wake-ups at the least
+
+
+class CollectorLock:
+    """Non-blocking inter-process lock so two collections never overlap."""
+
+    def __init__(self, path=LOCK_PATH):
+        self.path = path
+        self._fd = None
+
+    def acquire(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        if fcntl is None:
+            try:
+                self._fd = os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                return False
+        else:
+            self._fd = os.open(self.path, os.O_CREAT | os.O_WRONLY)
+            try:
+                fcntl.flock(self._fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                os.close(self._fd)
+                self._fd = None
+                return False
+        os.ftruncate(self._fd, 0)
+        os.write(self._fd, str(os.getpid()).encode())
+        return True
+
+    def release(self):
+        if self._fd is None:
+            return
+        if fcntl is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+        os.close(self._fd)
+        self._fd = None
+        if fcntl is None:
+            os.remove(self.path)
+
+
+def read_feed_state():
+    try:
+        with open(FEED_STATE_PATH, encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def is_collector_running():
+    lock = CollectorLock()
+    if lock.acquire():
+        lock.release()
+        return False
+    return True
+
+
+def record_run(entry):
+    os.makedirs(os.path.dirname(RUN_HISTORY_PATH) or ".", exist_ok=True)
+    with open(RUN_HISTORY_PATH, "a", encoding="utf-8") as f:
+        f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+
+def read_run_history(limit=20):
+    """Most recent runs first."""
+    try:
+        with open(RUN_HISTORY_PATH, encoding="utf-8") as f:
+            lines = f.readlines()[-limit:]
+    except FileNotFoundError:
+        return []
+    return [json.loads(line) for line in reversed(lines) if line.strip()]
+
+
+def run_collection(trigger="cli", force_refresh=False, due_only=False, feeds=None):
+    """One locked collection run; the outcome is appended to the run history.
+
+    ``feeds`` is the feed config to poll (default: feeds.json as it is now).
+    """
+    lock = CollectorLock()
+    started = datetime.now()
+    entry = {"started_at": started.strftime("%Y-%m-%d %H:%M:%S"), "trigger": trigger, "pid": os.getpid()}
+    if not lock.acquire():
+        entry.update({"status": "skipped", "result": "Another collection is already running."})
+        print(f"⏭️ {entry['result']}")
+        record_run(entry)
+        return entry
+
+    try:
+        from mct_media_collector import collect_media_data
+        result = collect_media_data(force_refresh=force_refresh, due_only=due_only, feeds=feeds)
+        entry.update({"status": "ok", "result": result})
+    except Exception as e:
+        traceback.print_exc()
+        entry.update({"status": "error", "result": f"{type(e).__name__}: {e}"})
+    finally:
+        lock.release()
+
+    finished = datetime.now()
+    entry.update({
+        "finished_at": finished.strftime("%Y-%m-%d %H:%M:%S"),
+        "duration": round((finished - started).total_seconds(), 1),
+    })
+    record_run(entry)
+    print(f"🏁 Run {entry['status']} in {entry['duration']}s — {entry['result']}")
+    return entry
+
+
+def launch_background_run(trigger="dashboard", force_refresh=False):
+    """Start a detached --once run (used by the dashboard button)."""
+    cmd = [sys.executable, os.path.abspath(__file__), "--once", "--trigger", trigger]
+    if force_refresh:
+        cmd.append("--force-refresh")
+    os.makedirs(DATA_DIR, exist_ok=True)
+    with open(os.path.join(DATA_DIR, "collector.log"), "a", encoding="utf-8") as log:
+        return subprocess.Popen(cmd, stdout=log, stderr=subprocess.STDOUT, start_new_session=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="MCT media collector (headless)")
+    parser.add_argument("--once", action="store_true", help="run a single collection and exit")
+    parser.add_argument("--interval", type=float, default=60,
+                        help="longest sleep between schedule checks, in minutes (picks up feeds.json edits)")
+    parser.add_argument("--force-refresh", action="store_true", help="ignore ETag/Last-Modified validators (first run)")
+    parser.add_argument("--trigger", default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.once:
+        entry = run_collection(args.trigger or "cli", force_refresh=args.force_refresh)
+        sys.exit(1 if entry["status"] == "error" else 0)
+
+    print("⏰ Collector daemon started — adaptive per-feed schedule")
+    force_refresh = args.force_refresh  # first run only
+    errors = 0
+    while True:
+        # Re-read every time, so edits to feeds.json apply without a restart
+        feeds = load_feeds_config()
+        feed_state = read_feed_state()
+        if due_feeds(feeds, feed_state):
+            entry = run_collection(args.trigger or "schedule", force_refresh=force_refresh,
+                                   due_only=True, feeds=feeds)
+            force_refresh = False
+            # A failed run leaves its feeds due; retry them with backoff, not in a tight loop
+            errors = errors + 1 if entry["status"] == "error" else 0
+            feed_state = read_feed_state()
+        next_poll = next_due_ts(feeds, feed_state)
+        wait = args.interval * 60 if next_poll is None else next_poll - time.time()
+        time.sleep(min(args.interval * 60, max(MIN_SLEEP * 2 ** errors, wait)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+# ===============================================
+# 🟣 MCT Media Monitoring — Early Deduplication
+# (seen-links index + MinHash/LSH near-duplicates)
+# ===============================================
+
+import hashlib
+import os
+import re
+import sqlite3
+from contextlib import closing
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+SHINGLE_SIZE = 3  # words per shingle
+MIN_TOKENS = 8  # shorter texts are too small to fingerprint reliably
+NUM_PERM = 60  # MinHash signature length
+BANDS = 20  # LSH bands of NUM_PERM // BANDS rows each
+JACCARD_THRESHOLD = 0.6  # estimated shingle overlap for a near-duplicate
+
+_TOKEN_RE = re.compile(r"\w+")
+_PRIME = np.uint64(4294967311)  # smallest prime above 2**32
+_rng = np.random.RandomState(20251001)  # fixed so signatures stay comparable across runs
+_PERM_A = _rng.randint(1, 2**32, size=NUM_PERM, dtype=np.uint64)
+_PERM_B = _rng.randint(0, 2**32, size=NUM_PERM, dtype=np.uint64)
+
+
+def minhash(text):
+    """MinHash signature (uint64 array) of word shingles, or None for very short texts."""
+    tokens = _TOKEN_RE.findall(str(text).lower())
+    if len(tokens) < MIN_TOKENS:
+        return None
+    shingles = {" ".join(tokens[i:i + SHINGLE_SIZE]) for i in range(len(tokens) - SHINGLE_SIZE + 1)}
+    hashes = np.fromiter(
+        (int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=4).digest(), "little") for s in shingles),
+        dtype=np.uint64,
+        count=len(shingles),
+    )
+    permuted = ((hashes[:, None] * _PERM_A) % _PRIME + _PERM_B) % _PRIME
+    return permuted.min(axis=0)
+
+
+def band_keys(sig):
+    """LSH band keys of a signature, or None when there is no signature."""
+    return _band_keys(sig) if isinstance(sig, np.ndarray) else None
+
+
+def jaccard(sig_a, sig_b):
+    """Estimated Jaccard similarity of two signatures."""
+    return float(np.mean(sig_a == sig_b))
+
+
+def _band_keys(sig):
+    rows = NUM_PERM // BANDS
+    return [
+        (i, hashlib.blake2b(sig[i * rows:(i + 1) * rows].tobytes(), digest_size=8).hexdigest())
+        for i in range(BANDS)
+    ]
+
+
+class SeenIndex:
+    """Persistent index of every link already processed and its MinHash.
+
+    Near-duplicate lookups go through LSH band keys, so only articles that
+    share at least one band are compared signature by signature.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._initialized = False
+
+    def _connect(self):
+        if not self._initialized:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30)
+        if not self._initialized:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS seen (
+                    link TEXT PRIMARY KEY,
+                    signature BLOB,
+                    canonical_link TEXT,
+                    first_seen TEXT
+                );
+                CREATE TABLE IF NOT EXISTS seen_bands (
+                    band INTEGER,
+                    band_key TEXT,
+                    link TEXT
+                );
+                CREATE INDEX IF NOT EXISTS seen_bands_key ON seen_bands(band_key, band);
+            """)
+            self._initialized = True
+        return conn
+
+    def existing_links(self, links):
+        links = list(dict.fromkeys(links))
+        found = set()
+        with closing(self._connect()) as conn:
+            for i in range(0, len(links), 500):
+                chunk = links[i:i + 500]
+                rows = conn.execute(
+                    f"SELECT link FROM seen WHERE link IN ({', '.join('?' for _ in chunk)})", chunk
+                ).fetchall()
+                found.update(r[0] for r in rows)
+        return found
+
+    def find_canonical(self, conn, sig, keys=None):
+        """Canonical link of the most similar stored near-duplicate, or None."""
+        keys = set(keys if isinstance(keys, list) else _band_keys(sig))
+        # One lookup for all bands; the band number is checked here
+        rows = conn.execute(
+            f"SELECT band, band_key, link FROM seen_bands WHERE band_key IN ({', '.join('?' for _ in keys)})",
+            [key for _, key in keys],
+        )
+        candidates = {link for band, key, link in rows if (band, key) in keys}
+        best = None
+        for link in candidates:
+            stored, canonical = conn.execute(
+                "SELECT signature, canonical_link FROM seen WHERE link = ?", (link,)
+            ).fetchone()
+            similarity = jaccard(sig, np.frombuffer(stored, dtype=np.uint64))
+            if similarity >= JACCARD_THRESHOLD and (best is None or similarity > best[0]):
+                best = (similarity, canonical or link)
+        return best[1] if best else None
+
+    def split(self, df, known_links=()):
+        """Drop already-seen links and separate near-duplicates.
+
+        Returns (unique, duplicates). Both carry "MinHash" and "MinHash Bands"
+        columns; ``duplicates`` also has "Duplicate Of" naming its canonical
+        Link. Either column already on ``df`` (e.g. computed by backfill
+        workers) is reused. Nothing is recorded until :meth:`add` is called.
+        """
+        df = df.drop_duplicates(subset="Link")
+        seen = self.existing_links(df["Link"]) | set(known_links)
+        df = df[~df["Link"].isin(seen)].copy()
+        if "MinHash" not in df.columns:
+            df["MinHash"] = df["Content"].map(minhash)
+        if "MinHash Bands" not in df.columns:
+            df["MinHash Bands"] = df["MinHash"].map(band_keys)
+
+        canonical_of = {}
+        batch_bands = {}  # band key -> [(signature, link)] for this batch's canonicals
+        with closing(self._connect()) as conn:
+            for link, sig, keys in zip(df["Link"], df["MinHash"], df["MinHash Bands"]):
+                if sig is None:
+                    continue
+                canonical = self.find_canonical(conn, sig, keys)
+                if canonical is None:
+                    near = [
+                        (jaccard(sig, other), other_link)
+                        for key in keys for other, other_link in batch_bands.get(key, [])
+                    ]
+                    near = [n for n in near if n[0] >= JACCARD_THRESHOLD]
+                    canonical = max(near)[1] if near else None
+                if canonical is not None:
+                    canonical_of[link] = canonical
+                else:
+                    for key in keys:
+                        batch_bands.setdefault(key, []).append((sig, link))
+
+        is_dup = df["Link"].isin(canonical_of)
+        duplicates = df[is_dup].copy()
+        duplicates["Duplicate Of"] = duplicates["Link"].map(canonical_of)
+        return df[~is_dup], duplicates
+
+    def add(self, df):
+        """Record processed rows (with "MinHash" and optional "MinHash Bands" / "Duplicate Of")."""
+        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        canonical = df["Duplicate Of"] if "Duplicate Of" in df.columns else pd.Series(None, index=df.index)
+        bands = df["MinHash Bands"] if "MinHash Bands" in df.columns else pd.Series(None, index=df.index)
+        seen_rows, band_rows = [], []
+        for link, sig, can, keys in zip(df["Link"], df["MinHash"], canonical, bands):
+            has_sig = isinstance(sig, np.ndarray)
+            can = can if isinstance(can, str) and can else None
+            seen_rows.append((link, sig.tobytes() if has_sig else None, can, now))
+            # Only canonical articles are indexed for matching; duplicates point at them
+            if has_sig and can is None:
+                band_rows.extend((band, key, link) for band, key in (keys if isinstance(keys, list) else _band_keys(sig)))
+        with closing(self._connect()) as conn, conn:
+            conn.executemany("INSERT OR IGNORE INTO seen VALUES (?, ?, ?, ?)", seen_rows)
+            conn.executemany("INSERT INTO seen_bands VALUES (?, ?, ?)", band_rows)
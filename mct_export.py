@@ -0,0 +1,75 @@
+# ===============================================
+# 🟣 MCT Media Monitoring — Chunked Exports
+# (Parquet / gzip CSV written row-chunk by row-chunk)
+# ===============================================
+
+import gzip
+import os
+import tempfile
+import time
+
+import pandas as pd
+
+# format -> (label, file extension, MIME type)
+EXPORT_FORMATS = {
+    "parquet": ("Parquet", ".parquet", "application/vnd.apache.parquet"),
+    "csv.gz": ("CSV (gzip)", ".csv.gz", "application/gzip"),
+}
+EXPORT_DIR = os.path.join(tempfile.gettempdir(), "mct_exports")
+EXPORT_MAX_AGE = 3600  # seconds an export file is kept
+CHUNK_SIZE = 50_000
+
+
+def iter_chunks(df, rows, chunk_size=CHUNK_SIZE):
+    """Row chunks of ``df`` at positions ``rows``; categoricals become plain text."""
+    for start in range(0, len(rows), chunk_size):
+        chunk = df.iloc[rows[start:start + chunk_size]]
+        categorical = [c for c in chunk.columns if isinstance(chunk[c].dtype, pd.CategoricalDtype)]
+        yield chunk.astype({c: object for c in categorical})
+
+
+def write_export(df, rows, fmt, chunk_size=CHUNK_SIZE):
+    """Write the selected rows to a new file in EXPORT_DIR and return its path.
+
+    Only one chunk is converted at a time, so memory stays at one chunk
+    however many rows are exported.
+    """
+    _, extension, _ = EXPORT_FORMATS[fmt]
+    prune_exports()
+    os.makedirs(EXPORT_DIR, exist_ok=True)
+    fd, path = tempfile.mkstemp(prefix="mct_data_", suffix=extension, dir=EXPORT_DIR)
+    os.close(fd)
+
+    if fmt == "csv.gz":
+        with gzip.open(path, "wt", encoding="utf-8", newline="", compresslevel=6) as f:
+            for i, chunk in enumerate(iter_chunks(df, rows, chunk_size)):
+                chunk.to_csv(f, header=i == 0, index=False)
+    else:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        # Fixed up front: a chunk whose text column is all empty must not
+        # change the column type
+        schema = pa.schema([
+            (col, pa.string() if dtype == object or isinstance(dtype, pd.CategoricalDtype) else pa.from_numpy_dtype(dtype))
+            for col, dtype in df.dtypes.items()
+        ])
+        with pq.ParquetWriter(path, schema, compression="zstd") as writer:
+            for chunk in iter_chunks(df, rows, chunk_size):
+                writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+    return path
+
+
+def prune_exports(max_age=EXPORT_MAX_AGE):
+    """Delete export files older than ``max_age`` seconds."""
+    try:
+        names = os.listdir(EXPORT_DIR)
+    except FileNotFoundError:
+        return
+    cutoff = time.time() - max_age
+    for name in names:
+        path = os.path.join(EXPORT_DIR, name)
+        try:
+            if os.path.getmtime(path) < cutoff:
+                os.remove(path)
+        except OSError:
+            pass
@@ -1,68 +1,138 @@
 # ===============================================
 # 🟣 MCT Media Monitoring Hybrid Collector (v4.0)
-# (RSS + Keywords + AI + Sentiment + GSheet Append)
+# (RSS + Keywords + AI + Sentiment + Local Store + GSheet Mirror)
 # ===============================================
 
 import feedparser
 import pandas as pd
+import numpy as np
 import re
-from bs4 import BeautifulSoup
-from textblob import TextBlob
+import html
 import json
-import gspread
-from google.oauth2.service_account import Credentials
-from openai import OpenAI
+from mct_ai_cache import AICache
+from mct_ai_batch import BatchClassifier, AI_THEMES
+from mct_store import MediaStore, RESULT_COLUMNS, DATE_FORMAT, parse_date
+from mct_dedup import SeenIndex
+from mct_sentiment import get_sentiment_engine
+from mct_metrics import RunMetrics, append_metrics
+from mct_scheduler import FEEDS_CONFIG_PATH, due_feeds, load_feeds_config, schedule_next
+from mct_relevance import RelevanceModel
 from datetime import datetime
-import streamlit as st
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import requests
 import time
+import calendar
+import math
+import os
 
 # =====================================================
-# 1️⃣ LOAD SECRETS AND INITIALIZE CLIENTS
+# 1️⃣ SECRETS AND LAZY CLIENTS
 # =====================================================
-
-GSHEET_JSON = st.secrets["GSHEET_JSON"]
-OPENAI_API_KEY = st.secrets["OPENAI_API_KEY"]
-RESULTS_SHEET_URL = st.secrets["RESULTS_SHEET_URL"]
-
-client_ai = OpenAI(api_key=OPENAI_API_KEY)
+# Secrets are read and clients built on first use, so importing this module
+# (dashboard start-up, the headless collector) stays cheap. The OpenAI and
+# Google libraries are imported inside the getters for the same reason.
 
 SCOPES = [
     "https://www.googleapis.com/auth/spreadsheets",
     "https://www.googleapis.com/auth/drive",
 ]
 
-if not GSHEET_JSON:
-    raise RuntimeError("❌ GSHEET_JSON missing in Streamlit secrets.")
+_clients = {}
+_clients_lock = threading.Lock()
 
-creds = Credentials.from_service_account_info(json.loads(GSHEET_JSON), scopes=SCOPES)
-client_gsheets = gspread.authorize(creds)
+def get_secret(name, default=None):
+    """Streamlit secret, falling back to an environment variable of the same name."""
+    try:
+        import streamlit as st
+        value = st.secrets.get(name)
+    except Exception:  # no secrets.toml, e.g. when run from cron
+        value = None
+    return value or os.environ.get(name) or default
+
+def get_openai_client():
+    with _clients_lock:
+        if "openai" not in _clients:
+            from openai import OpenAI
+            api_key = get_secret("OPENAI_API_KEY")
+            if not api_key:
+                raise RuntimeError("❌ OPENAI_API_KEY missing in Streamlit secrets.")
+            # Optional: point at any OpenAI-compatible server, e.g. mct_mock_openai.py
+            _clients["openai"] = OpenAI(api_key=api_key, base_url=get_secret("OPENAI_BASE_URL"))
+        return _clients["openai"]
+
+def get_gsheets_client():
+    """gspread client, or None when GSHEET_JSON is not configured."""
+    with _clients_lock:
+        if "gsheets" not in _clients:
+            gsheet_json = get_secret("GSHEET_JSON")
+            client = None
+            if gsheet_json:
+                import gspread
+                from google.oauth2.service_account import Credentials
+                creds = Credentials.from_service_account_info(json.loads(gsheet_json), scopes=SCOPES)
+                client = gspread.authorize(creds)
+            _clients["gsheets"] = client
+        return _clients["gsheets"]
+
+def sheets_mirror_enabled():
+    # Google Sheets is an optional mirror of the local store
+    return bool(get_secret("GSHEET_JSON") and get_secret("RESULTS_SHEET_URL"))
 
 # =====================================================
 # 2️⃣ RSS FEEDS (Top National & Regional Sources)
 # =====================================================
 
-FEEDS = [
-    "https://www.mwananchi.co.tz/feeds/rss.xml",
-    "https://www.thecitizen.co.tz/feeds/rss.xml",
-    "https://habarileo.co.tz/feed",
-    "https://www.dailynews.co.tz/feed",
-    "https://www.ippmedia.com/en/feed",
-    "https://mtanzania.co.tz/feed/",
-    "https://www.mwanahalisionline.com/feed/",
-    "https://millardayo.com/feed/",
-    "https://dar24.com/feed/",
-    "https://bongo5.com/feed/",
-    "https://www.globalpublishers.co.tz/feed/",
-    "https://sautikubwa.org/feed/",
-    "https://zanzibar24.co.tz/feed/",
-    "https://www.swahilitimes.co.tz/feed/",
-    "https://kivumbinews.co.tz/feed/",
-    "https://thechanzo.com/feed/",
-    "https://www.bbc.com/swahili/index.xml",
-    "https://www.voaswahili.com/rss",
-    "https://www.dw.com/overlay/rss/tz",
-    "https://allafrica.com/tools/headlines/rdf/tanzania/headlines.rdf"
-]
+# Feeds and their polling bounds are configured in feeds.json (see
+# mct_scheduler.py). It is read again for every run, so edits apply without
+# restarting the daemon or the dashboard.
+def get_feed_config():
+    """Every enabled feed (url + schedule settings), as polled by a manual run."""
+    return load_feeds_config(FEEDS_CONFIG_PATH)
+
+# Fetch engine settings: every feed gets its own worker and a hard timeout,
+# so a run takes about as long as the slowest feed instead of the sum.
+DATA_DIR = os.environ.get("MCT_DATA_DIR", "mct_data")
+FEED_STATE_PATH = os.path.join(DATA_DIR, "feed_state.json")
+FETCH_TIMEOUT = 20  # seconds per feed
+FETCH_WORKERS = 20
+FETCH_USER_AGENT = "MCT-Media-Monitoring/4.0 (+https://www.mct.or.tz)"
+
+# Local store is the system of record; the Results sheet mirrors it
+STORE_PATH = os.path.join(DATA_DIR, "media_store.sqlite3")
+SEEN_INDEX_PATH = os.path.join(DATA_DIR, "seen_index.sqlite3")
+# One JSON line per collection run (stage timings, feed health, AI and Sheets usage)
+METRICS_LOG_PATH = os.path.join(DATA_DIR, "metrics.jsonl")
+
+# Sentiment: "lexicon" (Swahili + English) or "textblob" (original, English only)
+SENTIMENT_ENGINE = "lexicon"
+SENTIMENT_POSITIVE_THRESHOLD = 0.1
+SENTIMENT_NEGATIVE_THRESHOLD = -0.1
+
+# AI classification: bump AI_PROMPT_VERSION whenever the prompt changes so
+# cached answers from the old prompt are no longer reused.
+AI_MODEL = "gpt-4o-mini"
+AI_PROMPT_VERSION = "v2-batch"
+AI_CACHE_PATH = os.path.join(DATA_DIR, "ai_cache.sqlite3")
+AI_CACHE_TTL = 90 * 24 * 3600  # seconds
+AI_CACHE_MAX_ENTRIES = 200_000
+AI_BATCH_SIZE = 10  # articles per request
+AI_MAX_WORKERS = 4  # concurrent requests
+AI_REQUESTS_PER_MINUTE = 500
+AI_TOKENS_PER_MINUTE = 200_000
+AI_MAX_RETRIES = 5
+
+# Tiered classification: keywords first, then the local relevance model,
+# and only what is left goes to OpenAI, within a daily budget.
+KEYWORD_CONFIDENT = 0.75  # keyword confidence at which the AI is not asked
+RELEVANCE_MIN = 0.2  # below this an article without keyword hits is off-topic
+AI_DAILY_BUDGET = 400  # articles sent to OpenAI per (UTC) day (cache hits are free); None = no cap
+REVIEW_BATCH = 2000  # stored unreviewed articles reconsidered per run while budget is left
+AI_BUDGET_PATH = os.path.join(DATA_DIR, "ai_budget.json")
+RELEVANCE_MODEL_PATH = os.path.join(DATA_DIR, "relevance_model.npz")
+RELEVANCE_RETRAIN_DAYS = 7
+RELEVANCE_MIN_LABELS = 200  # per class, before a model is trained
+RELEVANCE_TRAIN_LIMIT = 50_000  # most recent labelled articles used for training
 
 # =====================================================
 # 3️⃣ THEMATIC KEYWORDS (Full List – No Reduction)
@@ -131,189 +201,800 @@ THEME_KEYWORDS = {
 # 4️⃣ HELPER FUNCTIONS (Enhanced Cleaning & Retry)
 # =====================================================
 
-ai_cache = {}
+store = MediaStore(STORE_PATH)
+seen_index = SeenIndex(SEEN_INDEX_PATH)
+ai_cache = AICache(AI_CACHE_PATH, ttl_seconds=AI_CACHE_TTL, max_entries=AI_CACHE_MAX_ENTRIES)
+run_metrics = RunMetrics()
+
+# Regex-based tag stripper: same text as BeautifulSoup(...).get_text() on
+# feed markup, without building a tree. Script/style bodies, comments and
+# declarations are dropped, CDATA keeps its text, and "<" only opens a tag
+# when followed by a letter or "/" (so "a < b" survives).
+_WHITESPACE_RE = re.compile(r"\s+")
+_CDATA_RE = re.compile(r"<!\[CDATA\[(.*?)\]\]>", re.S)
+_SKIP_RE = re.compile(
+    r"<(script|style|template)\b[^>]*>.*?</\1\s*>|<!--.*?-->|<![^>]*>|<\?[^>]*>", re.S | re.I
+)
+_TAG_RE = re.compile(r"""</?[a-zA-Z](?:[^>"']|"[^"]*"|'[^']*')*>""")
 
 def clean_html(text):
-    clean = BeautifulSoup(str(text), "html.parser").get_text()
-    clean = re.sub(r"\s+", " ", clean)
-    return clean.strip()
+    text = str(text)
+    if "<" not in text and "&" not in text:
+        # Fast path: plain text only needs whitespace normalised
+        return _WHITESPACE_RE.sub(" ", text).strip()
+    if "<" in text:
+        # Escape CDATA text so the unescape below restores it verbatim
+        text = _CDATA_RE.sub(lambda m: m.group(1).replace("&", "&amp;").replace("<", "&lt;"), text)
+        text = _TAG_RE.sub("", _SKIP_RE.sub("", text))
+    return _WHITESPACE_RE.sub(" ", html.unescape(text)).strip()
+
+def clean_html_batch(texts):
+    """clean_html over a list; repeated strings (common across feeds) are cleaned once."""
+    cleaned = {}
+    return [cleaned[t] if t in cleaned else cleaned.setdefault(t, clean_html(t)) for t in texts]
+
+class KeywordMatcher:
+    """Single-pass theme matcher compiled once from a {theme: [keywords]} dict.
+
+    All phrases are folded into one trie-shaped regex, so a text is scanned
+    once no matter how many keywords there are. The results are the same as
+    running ``\bkeyword\b`` for every phrase separately.
+    """
+
+    def __init__(self, theme_keywords):
+        self.themes = list(theme_keywords)
+        self.keyword_themes = {}
+        for theme, keywords in theme_keywords.items():
+            for kw in keywords:
+                owners = self.keyword_themes.setdefault(kw.lower(), [])
+                if theme not in owners:
+                    owners.append(theme)
+
+        # The scan reports the longest phrase starting at each position, so
+        # shorter phrases that are whole-word prefixes of it are added here.
+        self.implied = {
+            kw: [p for p in self.keyword_themes if p != kw and kw.startswith(p) and self._is_boundary(kw, len(p))]
+            for kw in self.keyword_themes
+        }
+        self.pattern = re.compile(rf"\b(?=({self._trie_pattern(self.keyword_themes)})\b)")
+        self._keyword_bits = {
+            kw: sum(1 << self.themes.index(t) for t in {t for p in [kw] + self.implied[kw] for t in self.keyword_themes[p]})
+            for kw in self.keyword_themes
+        }
+
+    @staticmethod
+    def _is_boundary(text, i):
+        return bool(re.match(r"\w", text[i - 1])) != bool(re.match(r"\w", text[i]))
+
+    @staticmethod
+    def _trie_pattern(words):
+        trie = {}
+        for word in words:
+            node = trie
+            for ch in word:
+                node = node.setdefault(ch, {})
+            node[""] = True
+
+        def build(node):
+            branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+            if not branches:
+                return ""
+            body = "(?:" + "|".join(branches) + ")"
+            return body + "?" if "" in node else body
+
+        return build(trie)
+
+    def match(self, text):
+        """Return {theme: [matched keywords]} in THEME_KEYWORDS order."""
+        found = set()
+        for m in self.pattern.finditer(str(text).lower()):
+            kw = m.group(1)
+            found.add(kw)
+            found.update(self.implied[kw])
+
+        matches = {}
+        for kw in sorted(found):
+            for theme in self.keyword_themes[kw]:
+                matches.setdefault(theme, []).append(kw)
+        return {theme: matches[theme] for theme in self.themes if theme in matches}
+
+    # Keyword confidence: each hit adds its weight to a score that maps to
+    # 1 - exp(-score / SCORE_SCALE). One single-word hit deep in the summary
+    # gives ~0.39; a multi-word phrase in the title alone gives ~0.86.
+    TITLE_WEIGHT = 2.0
+    LEAD_WEIGHT = 1.5  # first fifth of the text
+    REPEAT_WEIGHT = 0.5  # the same keyword again
+    SCORE_SCALE = 2.0
+
+    def score(self, text, title_length=0):
+        """(mask, confidence) for one text whose first ``title_length`` characters are its title."""
+        text = str(text).lower()
+        lead = max(title_length, len(text) // 5)
+        found, score, seen = 0, 0.0, set()
+        for m in self.pattern.finditer(text):
+            kw = m.group(1)
+            found |= self._keyword_bits[kw]
+            # Multi-word phrases are more specific than single words
+            weight = min(2.0, 1 + 0.5 * kw.count(" "))
+            if m.start() < title_length:
+                weight *= self.TITLE_WEIGHT
+            elif m.start() < lead:
+                weight *= self.LEAD_WEIGHT
+            if kw in seen:
+                weight *= self.REPEAT_WEIGHT
+            seen.add(kw)
+            score += weight
+        return found, 1 - math.exp(-score / self.SCORE_SCALE)
+
+keyword_matcher = KeywordMatcher(THEME_KEYWORDS)
+
+def match_theme_keywords(text):
+    """Themes found in text together with the keywords that triggered them."""
+    return keyword_matcher.match(text)
 
 def detect_themes(text):
-    text_lower = str(text).lower()
-    detected = []
-    for theme, keywords in THEME_KEYWORDS.items():
-        for kw in keywords:
-            if re.search(rf"\b{re.escape(kw)}\b", text_lower):
-                detected.append(theme)
-                break
-    return detected
+    return list(keyword_matcher.match(text))
+
+sentiment_engine = get_sentiment_engine(
+    SENTIMENT_ENGINE,
+    positive_threshold=SENTIMENT_POSITIVE_THRESHOLD,
+    negative_threshold=SENTIMENT_NEGATIVE_THRESHOLD,
+)
+
+def detect_sentiment_batch(texts):
+    """Sentiment labels for a whole column in one call."""
+    with run_metrics.stage("sentiment"):
+        return sentiment_engine.label_batch(texts)
 
 def detect_sentiment(text):
-    score = TextBlob(str(text)).sentiment.polarity
-    if score > 0.1:
-        return "Positive"
-    elif score < -0.1:
-        return "Negative"
-    return "Neutral"
+    return detect_sentiment_batch([text])[0]
+
+def get_ai_classifier():
+    with _clients_lock:
+        classifier = _clients.get("ai_classifier")
+    if classifier is None:
+        classifier = BatchClassifier(
+            get_openai_client(),
+            model=AI_MODEL,
+            prompt_version=AI_PROMPT_VERSION,
+            cache=ai_cache,
+            batch_size=AI_BATCH_SIZE,
+            max_workers=AI_MAX_WORKERS,
+            requests_per_minute=AI_REQUESTS_PER_MINUTE,
+            tokens_per_minute=AI_TOKENS_PER_MINUTE,
+            max_retries=AI_MAX_RETRIES,
+            metrics=run_metrics,
+        )
+        with _clients_lock:
+            classifier = _clients.setdefault("ai_classifier", classifier)
+    return classifier
+
+def ai_classify_themes_batch(texts):
+    """Classify {article_id: text} in concurrent batches; returns {article_id: [themes]}."""
+    return get_ai_classifier().classify(texts)
 
 def ai_classify_themes(text):
-    # Use cache to avoid repeated GPT calls
-    if text in ai_cache:
-        return ai_cache[text]
-
-    prompt = f"""
-    You are an assistant for media monitoring in Tanzania.
-    Classify the following text into one or more of these themes:
-    1. Media Freedom
-    2. Journalist Safety
-    3. Media Economy
-    4. Violations & Complaints
-    5. Political Bias
-    6. Public Sentiment
-    7. Social & Human Rights Issues
-    8. Analytics & AI Monitoring
-    Return only a comma-separated list of matching theme names.
-    Text:
-    {text}
-    """
-    for attempt in range(2):  # Retry once if API call fails
-        try:
-            resp = client_ai.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0
-            )
-            answer = resp.choices[0].message.content.strip()
-            result = [x.strip() for x in answer.split(",") if x.strip()]
-            ai_cache[text] = result
-            return result
-        except Exception as e:
-            print(f"⚠️ AI tagging failed (attempt {attempt+1}):", e)
-            time.sleep(2)
-    ai_cache[text] = []
-    return []
+    return ai_classify_themes_batch({0: text})[0]
 
 # =====================================================
-# 5️⃣ FETCH RSS (Full History)
+# 5️⃣ FETCH RSS (Concurrent + Conditional GET)
 # =====================================================
 
-def fetch_rss():
+def load_feed_state():
+    """Per-feed ETag/Last-Modified validators, watermark and last fetch status."""
+    try:
+        with open(FEED_STATE_PATH, encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def save_feed_state(state):
+    os.makedirs(os.path.dirname(FEED_STATE_PATH) or ".", exist_ok=True)
+    tmp_path = FEED_STATE_PATH + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(state, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, FEED_STATE_PATH)
+
+def fetch_feed(url, cached=None, timeout=FETCH_TIMEOUT):
+    """Fetch one feed with a timeout and conditional headers.
+
+    Returns a result dict with the HTTP status, latency and parsed entries.
+    A 304 (unchanged since the last run) comes back with no entries.
+    """
+    cached = cached or {}
+    headers = {"User-Agent": FETCH_USER_AGENT}
+    if cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+    if cached.get("modified"):
+        headers["If-Modified-Since"] = cached["modified"]
+
+    result = {
+        "url": url,
+        "source": cached.get("title", url),
+        "status": None,
+        "latency": None,
+        "entries": [],
+        "etag": cached.get("etag"),
+        "modified": cached.get("modified"),
+        "error": None,
+    }
+    started = time.perf_counter()
+    try:
+        resp = requests.get(url, headers=headers, timeout=timeout)
+        result["status"] = resp.status_code
+        if resp.status_code == 304:
+            return result
+        resp.raise_for_status()
+
+        feed = feedparser.parse(
+            resp.content,
+            response_headers={k.lower(): v for k, v in resp.headers.items()},
+        )
+        result["source"] = feed.feed.get("title", url)
+        result["entries"] = feed.entries
+        result["etag"] = resp.headers.get("ETag")
+        result["modified"] = resp.headers.get("Last-Modified")
+    except Exception as e:
+        result["error"] = str(e)
+    finally:
+        result["latency"] = round(time.perf_counter() - started, 3)
+    return result
+
+def entry_key(entry):
+    return entry.get("id") or entry.get("link") or ""
+
+def entry_timestamp(entry):
+    """UTC epoch seconds of the entry's publish (or update) time, or None."""
+    parsed = entry.get("published_parsed") or entry.get("updated_parsed")
+    return calendar.timegm(parsed) if parsed else None
+
+def split_new_entries(entries, watermark):
+    """Entries newer than a feed's watermark, and the watermark after this fetch.
+
+    The watermark holds the newest publish time seen (plus the ids published
+    at exactly that second) and the id of the entry at the top of the feed.
+    Dated entries are compared by time; undated ones are new until the last
+    seen top entry comes up, since feeds list newest first.
+    """
+    watermark = watermark or {}
+    mark_ts = watermark.get("published_ts")
+    mark_ids = set(watermark.get("ids_at_published", []))
+    last_id = watermark.get("last_id")
+
+    new, reached_last = [], False
+    newest_ts, newest_ids = mark_ts, set(mark_ids)
+    now = time.time()
+    for entry in entries:
+        key, ts = entry_key(entry), entry_timestamp(entry)
+        reached_last = reached_last or (last_id is not None and key == last_id)
+        if ts is None:
+            if not reached_last:
+                new.append(entry)
+            continue
+        if mark_ts is None or ts > mark_ts or (ts == mark_ts and key not in mark_ids):
+            new.append(entry)
+        # Future-dated entries do not move the watermark, or they would hide
+        # everything published until then
+        if ts <= now:
+            if newest_ts is None or ts > newest_ts:
+                newest_ts, newest_ids = ts, {key}
+            elif ts == newest_ts:
+                newest_ids.add(key)
+
+    updated = {
+        "last_id": entry_key(entries[0]) if entries else last_id,
+        "published_ts": newest_ts,
+        "published": time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(newest_ts)) if newest_ts else None,
+        "ids_at_published": sorted(newest_ids),
+    }
+    return new, updated
+
+def fetch_rss(force_refresh=False, feeds=None):
+    """Fetch ``feeds`` (feed config dicts, default: every enabled feed) and keep
+    only entries past each feed's watermark.
+
+    Returns (df, feed_state). The state is not saved here: the caller saves
+    it once the articles are stored, so a failed run re-reads the same entries.
+    Each polled feed's next poll time is rescheduled in the state.
+    """
+    feeds = get_feed_config() if feeds is None else feeds
+    feed_settings = {f["url"]: f for f in feeds}
+    feed_state = load_feed_state()
+    # force_refresh skips the stored validators and watermarks and re-reads
+    # every feed in full (the watermarks still advance)
+    validators = {} if force_refresh else feed_state
+
+    workers = max(1, min(FETCH_WORKERS, len(feeds)))
+    with run_metrics.stage("fetch"), ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(lambda u: fetch_feed(u, validators.get(u)), feed_settings))
+
     records = []
-    for url in FEEDS:
-        try:
-            feed = feedparser.parse(url)
-            source = feed.feed.get("title", url)
-            total = len(feed.entries)
-            print(f"📡 {source} — {total} entries")
+    for res in results:
+        url, source = res["url"], res["source"]
+        if res["error"]:
+            print(f"⚠️ Failed to fetch {url} ({res['latency']}s): {res['error']}")
+        elif res["status"] == 304:
+            print(f"⏸️ {source} — not modified ({res['latency']}s)")
+        else:
+            print(f"📡 {source} — {len(res['entries'])} entries ({res['latency']}s)")
+
+        entry_state = feed_state.get(url, {})
+        watermark = None if force_refresh else entry_state.get("watermark")
+        entries, new_watermark = split_new_entries(res["entries"], watermark)
+        if res["entries"]:
+            print(f"   ↳ {len(entries)} new since the last run")
 
-            for entry in feed.entries:
+        try:
+            for entry in entries:
                 title = entry.get("title", "")
                 summary = entry.get("summary", "")
-                text = clean_html(f"{title} {summary}")
 
+                # feedparser's parsed time is already UTC; the raw string is
+                # only parsed when it could not be
+                ts = entry_timestamp(entry)
                 published = (
-                    entry.get("published")
-                    or entry.get("updated")
-                    or datetime.now().strftime("%Y-%m-%d")
+                    pd.Timestamp(ts, unit="s") if ts is not None
+                    else parse_date(entry.get("published") or entry.get("updated"))
                 )
 
                 records.append({
                     "Platform": source,
-                    "Content": text,
+                    "Title": title,
+                    "Content": f"{title} {summary}",  # cleaned in one batch below
                     "Link": entry.get("link", ""),
-                    "Date": published
+                    "Date": published,
+                    "Date Imputed": published is None,
                 })
         except Exception as e:
             print(f"⚠️ Failed to parse {url}: {e}")
 
+        if not res["error"]:
+            entry_state.update({"etag": res["etag"], "modified": res["modified"], "title": source})
+            if res["entries"]:
+                entry_state["watermark"] = new_watermark
+        entry_state.update({
+            "status": res["status"],
+            "latency": res["latency"],
+            "error": res["error"],
+            "entries": len(res["entries"]),
+            "new_entries": len(entries),
+            "checked_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        })
+        entry_state["schedule"] = schedule_next(
+            entry_state.get("schedule"),
+            feed_settings[url],
+            now=time.time(),
+            ok=not res["error"],
+            timestamps=[ts for ts in map(entry_timestamp, res["entries"]) if ts is not None],
+            new_entries=len(entries),
+        )
+        feed_state[url] = entry_state
+        run_metrics.feed(url, source, res["status"], res["latency"], res["error"],
+                         len(res["entries"]), len(entries))
+
     df = pd.DataFrame(records)
-    print(f"✅ Total collected: {len(df)}")
-    return df
+    if not df.empty:
+        with run_metrics.stage("clean"):
+            df["Content"] = clean_html_batch(df["Content"].tolist())
+            df["Title"] = clean_html_batch(df["Title"].tolist())
+        # Undated entries get the fetch time (UTC) and keep the imputed flag
+        fetched_at = pd.Timestamp.now(tz="UTC").tz_localize(None).floor("s")
+        df["Date"] = pd.to_datetime(df["Date"].where(~df["Date Imputed"], fetched_at))
+    slowest = max((r["latency"] or 0 for r in results), default=0)
+    print(f"✅ Total collected: {len(df)} (slowest feed {slowest}s)")
+    return df, feed_state
 
 # =====================================================
 # 6️⃣ DETERMINE MEDIA SECTOR IMPACT
 # =====================================================
 
+# Every theme label an article can carry, keyword themes first so that bit i
+# of a KeywordMatcher mask is THEME_LABELS[i]. "All Themes" lists labels in
+# this order.
+THEME_LABELS = list(THEME_KEYWORDS) + [t for t in AI_THEMES if t not in THEME_KEYWORDS]
+THEME_BITS = {label: 1 << i for i, label in enumerate(THEME_LABELS)}
+
+DIRECT_IMPACT_KEYWORDS = [
+    "Media Freedom", "Vyombo vya Habari", "Journalist Safety",
+    "Media Economy", "Ukiukaji", "Malalamiko"
+]
+INDIRECT_IMPACT_KEYWORDS = [
+    "Political Coverage", "Public Sentiment", "Social", "Human Rights"
+]
+
 def determine_media_impact(row):
     themes = row.get("All Themes", "")
-    if any(keyword in themes for keyword in [
-        "Media Freedom", "Vyombo vya Habari", "Journalist Safety",
-        "Media Economy", "Ukiukaji", "Malalamiko"
-    ]):
+    if any(keyword in themes for keyword in DIRECT_IMPACT_KEYWORDS):
         return "Direct Impact on Media Sector"
-    elif any(keyword in themes for keyword in [
-        "Political Coverage", "Public Sentiment", "Social", "Human Rights"
-    ]):
+    elif any(keyword in themes for keyword in INDIRECT_IMPACT_KEYWORDS):
         return "Indirect / Contextual Impact"
     return "No Direct Impact"
 
+# The keyword tests above only ever hit inside a single label, so each label's
+# impact can be decided once and looked up by bit
+DIRECT_IMPACT_MASK = sum(b for label, b in THEME_BITS.items() if any(k in label for k in DIRECT_IMPACT_KEYWORDS))
+INDIRECT_IMPACT_MASK = sum(b for label, b in THEME_BITS.items() if any(k in label for k in INDIRECT_IMPACT_KEYWORDS))
+
+def labels_to_mask(labels):
+    return sum(THEME_BITS[label] for label in set(labels) if label in THEME_BITS)
+
+def themes_from_masks(masks):
+    """Vectorized "All Themes" strings; each distinct mask is decoded once."""
+    lookup = {
+        m: ", ".join(label for label, b in THEME_BITS.items() if m & b) or "—"
+        for m in masks.unique()
+    }
+    return masks.map(lookup)
+
+def media_impact_from_masks(masks):
+    values = masks.to_numpy(dtype=np.int64)
+    impact = np.select(
+        [(values & DIRECT_IMPACT_MASK) != 0, (values & INDIRECT_IMPACT_MASK) != 0],
+        ["Direct Impact on Media Sector", "Indirect / Contextual Impact"],
+        default="No Direct Impact",
+    )
+    return pd.Series(impact, index=masks.index)
+
 # =====================================================
-# 7️⃣ UPLOAD TO GOOGLE SHEET (Append + No Duplicates)
+# 7️⃣ UPLOAD TO GOOGLE SHEET (Incremental Append + No Duplicates)
 # =====================================================
 
-def upload_to_gsheet(df, sheet_title="Results"):
-    if not RESULTS_SHEET_URL or "/d/" not in RESULTS_SHEET_URL:
+def upload_to_gsheet(df, sheet_title="Results", client=None, sheet_url=None):
+    """Append rows whose Link is not yet in the sheet; returns the number appended.
+
+    ``client``/``sheet_url`` default to the configured gspread client and
+    RESULTS_SHEET_URL (benchmarks pass a fake client instead).
+    """
+    with run_metrics.stage("upload"):
+        return _upload_to_gsheet(df, sheet_title, client, sheet_url)
+
+def _sheets_call(fn, *args, **kwargs):
+    """One Sheets API round trip, counted in the run metrics."""
+    run_metrics.incr("sheets.calls")
+    return fn(*args, **kwargs)
+
+def _upload_to_gsheet(df, sheet_title, client, sheet_url):
+    import gspread
+    client_gsheets = client or get_gsheets_client()
+    results_sheet_url = sheet_url or get_secret("RESULTS_SHEET_URL")
+    if client_gsheets is None:
+        raise RuntimeError("❌ GSHEET_JSON missing in Streamlit secrets.")
+    if not results_sheet_url or "/d/" not in results_sheet_url:
         raise RuntimeError("❌ RESULTS_SHEET_URL invalid or missing in secrets.")
 
-    key = RESULTS_SHEET_URL.split("/d/")[1].split("/")[0]
-    sh = client_gsheets.open_by_key(key)
+    key = results_sheet_url.split("/d/")[1].split("/")[0]
+    sh = _sheets_call(client_gsheets.open_by_key, key)
 
     try:
-        ws = sh.worksheet(sheet_title)
+        ws = _sheets_call(sh.worksheet, sheet_title)
     except gspread.exceptions.WorksheetNotFound:
-        ws = sh.add_worksheet(title=sheet_title, rows=2000, cols=26)
+        ws = _sheets_call(sh.add_worksheet, title=sheet_title, rows=2000, cols=26)
 
-    expected_columns = [
-        "Platform", "Content", "Link", "Date",
-        "All Themes", "Sentiment", "Media Sector Impact", "Collected At"
-    ]
+    expected_columns = RESULT_COLUMNS
+    df = df.copy()
     for col in expected_columns:
         if col not in df.columns:
             df[col] = ""
 
     df = df[expected_columns]
-    df["Date"] = pd.to_datetime(df["Date"], errors="coerce").dt.strftime("%Y-%m-%d %H:%M:%S")
-
-    existing_data = ws.get_all_records()
-    if existing_data:
-        existing_df = pd.DataFrame(existing_data)
-        new_df = df[~df["Link"].isin(existing_df["Link"])]
-        final_df = pd.concat([existing_df, new_df], ignore_index=True)
-    else:
-        final_df = df
-
-    ws.clear()
-    ws.append_row(list(final_df.columns), value_input_option="USER_ENTERED")
-
-    rows = final_df.astype(str).fillna("").values.tolist()
-    CHUNK = 300
+    if pd.api.types.is_datetime64_any_dtype(df["Date"]):
+        df["Date"] = df["Date"].dt.strftime(DATE_FORMAT)  # already UTC from ingest
+
+    # Only the header and the Link column are read; existing rows are never rewritten
+    header = _sheets_call(ws.row_values, 1)
+    if not header:
+        _sheets_call(ws.append_row, expected_columns, value_input_option="USER_ENTERED")
+        header = expected_columns
+    elif "Link" not in header:
+        raise RuntimeError(f"❌ Sheet '{sheet_title}' has no 'Link' column to deduplicate on.")
+
+    existing_links = set(_sheets_call(ws.col_values, header.index("Link") + 1)[1:])
+    new_df = df[~df["Link"].isin(existing_links)].drop_duplicates(subset="Link")
+
+    # Follow the sheet's own column order; columns we don't produce stay blank
+    rows = new_df.reindex(columns=header).fillna("").astype(str).values.tolist()
+    CHUNK = 500
     for i in range(0, len(rows), CHUNK):
-        ws.append_rows(rows[i:i + CHUNK], value_input_option="USER_ENTERED")
+        _sheets_call(ws.append_rows, rows[i:i + CHUNK], value_input_option="USER_ENTERED", table_range="A1")
+    run_metrics.incr("sheets.rows_appended", len(rows))
 
-    print(f"✅ Appended {len(df)} new rows (total {len(final_df)} records).")
+    print(f"✅ Appended {len(new_df)} new rows ({len(existing_links)} already in sheet).")
+    return len(new_df)
 
 # =====================================================
 # 8️⃣ MAIN COLLECTOR FUNCTION
 # =====================================================
 
-def collect_media_data():
-    df = fetch_rss()
-    if df.empty:
-        return "No articles fetched from RSS feeds."
+# Where an article's themes came from ("Theme Source" in the store)
+SOURCE_KEYWORD = "keyword"  # keyword hits only
+SOURCE_AI = "ai"  # sent to the AI (together with any keyword hits)
+SOURCE_FILTERED = "filtered"  # judged off-topic by the relevance model
+SOURCE_UNREVIEWED = "unreviewed"  # no keyword hit, left out by the AI budget (retried later)
+
+def score_keywords(df):
+    """Keyword theme masks and confidence (0-1) for every article.
 
-    df["Detected Themes"] = df["Content"].apply(detect_themes)
-    df["AI Themes"] = df.apply(lambda r: ai_classify_themes(r["Content"]) if not r["Detected Themes"] else [], axis=1)
-    df["All Themes"] = df.apply(
-        lambda r: ", ".join(set(r["Detected Themes"] + r["AI Themes"])) if (r["Detected Themes"] or r["AI Themes"]) else "—",
-        axis=1
+    A "Title" column, when present, lets hits in the title count for more.
+    """
+    titles = df["Title"].fillna("").str.len() if "Title" in df.columns else pd.Series(0, index=df.index)
+    titles = titles + (titles > 0)  # Content is "<title> <summary>"
+    with run_metrics.stage("themes"):
+        scored = [keyword_matcher.score(text, n) for text, n in zip(df["Content"], titles)]
+    masks = pd.Series([m for m, _ in scored], index=df.index, dtype=np.int64)
+    confidence = pd.Series([c for _, c in scored], index=df.index, dtype=float)
+    return masks, confidence
+
+def train_relevance_model():
+    """Fit the relevance model on stored labels; returns it, or None if there are too few.
+
+    Relevant = any theme. Off-topic = no theme after the AI had its say
+    (or from before tiering). Filtered and unreviewed articles are left out,
+    so the model never learns from its own guesses.
+    """
+    labelled = store.read(columns=["Content", "All Themes", "Theme Source"], limit=RELEVANCE_TRAIN_LIMIT)
+    labelled = labelled[~labelled["Theme Source"].isin([SOURCE_FILTERED, SOURCE_UNREVIEWED])]
+    relevant = labelled["All Themes"].fillna("—").ne("—")
+    if min(relevant.sum(), (~relevant).sum()) < RELEVANCE_MIN_LABELS:
+        return None
+    with run_metrics.stage("relevance_training"):
+        model = RelevanceModel.train(labelled["Content"].fillna("").tolist(), relevant.to_numpy())
+    os.makedirs(os.path.dirname(RELEVANCE_MODEL_PATH) or ".", exist_ok=True)
+    model.save(RELEVANCE_MODEL_PATH)
+    print(f"🎯 Relevance model trained on {len(labelled)} labelled articles")
+    return model
+
+def get_relevance_model(train=True):
+    """The saved relevance model, or None before enough labels exist.
+
+    With ``train`` it is retrained once older than RELEVANCE_RETRAIN_DAYS.
+    The answer is cached for an hour, so a missing model is not retried on
+    every call.
+    """
+    with _clients_lock:
+        cached = _clients.get("relevance")
+    if cached is not None and time.time() - cached[1] < 3600:
+        return cached[0]
+    model = None
+    stale = (
+        not os.path.exists(RELEVANCE_MODEL_PATH)
+        or time.time() - os.path.getmtime(RELEVANCE_MODEL_PATH) > RELEVANCE_RETRAIN_DAYS * 86400
     )
-    df["Sentiment"] = df["Content"].apply(detect_sentiment)
-    df["Media Sector Impact"] = df.apply(determine_media_impact, axis=1)
+    if train and stale:
+        try:
+            model = train_relevance_model()
+        except Exception as e:
+            print(f"⚠️ Relevance model training failed: {e}")
+    if model is None and os.path.exists(RELEVANCE_MODEL_PATH):
+        model = RelevanceModel.load(RELEVANCE_MODEL_PATH)
+    with _clients_lock:
+        _clients["relevance"] = (model, time.time())
+    return model
+
+def relevance_scores(texts, train=True):
+    """Probability that each text is on-topic, or NaN for all when no model is trained yet."""
+    model = get_relevance_model(train)
+    if model is None:
+        return np.full(len(texts), np.nan)
+    with run_metrics.stage("relevance"):
+        return model.predict(list(texts))
+
+def ai_budget_remaining():
+    """Articles that may still go to OpenAI today (None: no cap)."""
+    if AI_DAILY_BUDGET is None:
+        return None
+    try:
+        with open(AI_BUDGET_PATH, encoding="utf-8") as f:
+            usage = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        usage = {}
+    used = usage.get("used", 0) if usage.get("day") == time.strftime("%Y-%m-%d", time.gmtime()) else 0
+    return max(0, AI_DAILY_BUDGET - used)
+
+def record_ai_usage(articles):
+    day = time.strftime("%Y-%m-%d", time.gmtime())
+    remaining = ai_budget_remaining()
+    used = 0 if remaining is None else AI_DAILY_BUDGET - remaining
+    os.makedirs(os.path.dirname(AI_BUDGET_PATH) or ".", exist_ok=True)
+    with open(AI_BUDGET_PATH, "w", encoding="utf-8") as f:
+        json.dump({"day": day, "used": used + articles}, f)
+
+def plan_escalation(masks, confidence, relevance, budget):
+    """Theme Source for each article; SOURCE_AI marks the ones to send to the AI.
+
+    Confident keyword hits stay keyword-only and off-topic articles without
+    hits are filtered. The rest are ranked by expected gain,
+    relevance x (1 - keyword confidence), and the top ``budget`` (all when
+    None) escalate. Without a relevance score (no model trained yet) any
+    keyword hit is kept as is, as before tiering, and articles without hits
+    count as 0.5 relevant.
+    """
+    has_hits = (masks != 0).to_numpy()
+    relevance = np.asarray(relevance, dtype=float)
+    unscored = np.isnan(relevance)
+    relevance = np.where(unscored, 0.5, relevance)
+    confidence = confidence.to_numpy()
+
+    plan = np.where(has_hits, SOURCE_KEYWORD, SOURCE_UNREVIEWED).astype(object)
+    plan[~has_hits & (relevance < RELEVANCE_MIN)] = SOURCE_FILTERED
+    uncertain_hits = has_hits & (confidence < KEYWORD_CONFIDENT) & ~unscored
+    candidates = np.flatnonzero((plan == SOURCE_UNREVIEWED) | uncertain_hits)
+    gain = relevance[candidates] * (1 - confidence[candidates])
+    ranked = candidates[np.argsort(-gain, kind="stable")]
+    plan[ranked if budget is None else ranked[:budget]] = SOURCE_AI
+    return pd.Series(plan, index=masks.index)
+
+def escalate_themes(df, masks, confidence, relevance=None, classify_ai=None, budget=None):
+    """Add "Theme Mask", "All Themes", "Media Sector Impact" and "Theme Source".
+
+    The articles picked by :func:`plan_escalation` go to the AI in one
+    batched call; its themes are added to their keyword themes.
+    """
+    classify_ai = classify_ai or ai_classify_themes_batch
+    df = df.copy()
+    if relevance is None:
+        relevance = relevance_scores(df["Content"])
+    plan = plan_escalation(masks, confidence, relevance, budget)
+    escalate = plan == SOURCE_AI
+    for source, count in plan.value_counts().items():
+        run_metrics.incr(f"classify.{source}", int(count))
+
+    with run_metrics.stage("ai"):
+        ai_results = classify_ai(df.loc[escalate, "Content"].to_dict()) if escalate.any() else {}
+    ai_masks = pd.Series({i: labels_to_mask(t) for i, t in ai_results.items()}, dtype=np.int64)
+    masks = masks | ai_masks.reindex(df.index, fill_value=0)
+
+    df["Theme Mask"] = masks
+    df["All Themes"] = themes_from_masks(masks)
+    df["Media Sector Impact"] = media_impact_from_masks(masks)
+    df["Theme Source"] = plan
+    return df
+
+def enrich_themes(df, classify_ai=None):
+    """Tiered theme tagging: keyword confidence, local relevance, then AI within the daily budget.
+
+    Themes are carried as a bitmask over THEME_LABELS (see escalate_themes).
+    """
+    masks, confidence = score_keywords(df)
+    budget = ai_budget_remaining()
+    # Only articles the classifier actually sent count; cached answers are free
+    sent = run_metrics.count("ai.cache_misses")
+    df = escalate_themes(df, masks, confidence, classify_ai=classify_ai, budget=budget)
+    if budget is not None:
+        record_ai_usage(run_metrics.count("ai.cache_misses") - sent)
+    return df
+
+def review_unreviewed(classify_ai=None):
+    """Give stored "unreviewed" articles another pass with today's leftover AI budget.
+
+    The newest REVIEW_BATCH of them are scored again like new articles
+    (keywords, relevance, then the AI within the budget), and every one
+    whose Theme Source changes is rewritten in the store, together with
+    its near-duplicates. Rows already mirrored to Google Sheets keep the
+    themes they were uploaded with. Returns the number of articles updated.
+    """
+    if ai_budget_remaining() == 0:
+        return 0
+    backlog = store.read(theme_source=SOURCE_UNREVIEWED, duplicates=False,
+                         columns=["Link", "Content"], limit=REVIEW_BATCH)
+    if backlog.empty:
+        return 0
+    reviewed = enrich_themes(backlog, classify_ai)
+    reviewed = reviewed[reviewed["Theme Source"] != SOURCE_UNREVIEWED]
+    with run_metrics.stage("store"):
+        store.update_enrichment(reviewed)
+    run_metrics.incr("articles.reviewed", len(reviewed))
+    print(f"🔁 Reviewed {len(reviewed)} of {len(backlog)} articles left out by earlier AI budgets")
+    return len(reviewed)
+
+def enrich_articles(df, classify_ai=None):
+    df = enrich_themes(df, classify_ai)
+    df["Sentiment"] = detect_sentiment_batch(df["Content"])
+    return df
+
+ENRICHED_COLUMNS = ["All Themes", "Sentiment", "Media Sector Impact", "Theme Source"]
+
+def dedup_articles(df):
+    """Keep only unseen articles; near-duplicates are returned separately.
+
+    Links already in the store or the seen index are dropped. Syndicated
+    copies (MinHash near-duplicates of an earlier article) come back in the
+    second frame with "Duplicate Of" set, so they can skip enrichment.
+    """
+    unique, duplicates = seen_index.split(df, known_links=store.existing_links(df["Link"]))
+    # A duplicate can only inherit from a canonical we can actually read
+    available = set(unique["Link"]) | store.existing_links(duplicates["Duplicate Of"])
+    orphans = ~duplicates["Duplicate Of"].isin(available)
+    unique = pd.concat([unique, duplicates[orphans]])
+    return unique, duplicates[~orphans]
+
+def inherit_enrichment(duplicates, enriched):
+    """Copy theme, sentiment and impact from each duplicate's canonical article."""
+    if duplicates.empty:
+        return duplicates
+    source = enriched.set_index("Link").reindex(columns=ENRICHED_COLUMNS)
+    missing = set(duplicates["Duplicate Of"]) - set(source.index)
+    if missing:
+        stored = store.lookup(missing, ["Link"] + ENRICHED_COLUMNS).set_index("Link")
+        source = pd.concat([source, stored])
+    inherited = source.reindex(duplicates["Duplicate Of"])
+    duplicates = duplicates.copy()
+    for col in ENRICHED_COLUMNS:
+        duplicates[col] = inherited[col].to_numpy()
+    return duplicates
+
+def collect_media_data(force_refresh=False, due_only=False, feeds=None):
+    """Run one collection; its metrics go to METRICS_LOG_PATH even when it fails.
+
+    ``feeds`` is the feed config to use (default: feeds.json as it is now).
+    ``due_only`` polls just the feeds whose scheduled time has come
+    (scheduled runs); otherwise every feed is polled (manual runs).
+    """
+    run_metrics.reset()
+    cache_before = ai_cache.stats()  # the cache counters span the whole process
+    status, result = "error", None
+    try:
+        feeds = get_feed_config() if feeds is None else feeds
+        if due_only:
+            due = set(due_feeds(feeds, load_feed_state()))
+            feeds = [f for f in feeds if f["url"] in due]
+        result = _collect_media_data(force_refresh, feeds)
+        reviewed = review_unreviewed() if feeds else 0
+        if reviewed:
+            result += f" Reviewed {reviewed} earlier unreviewed articles."
+        status = "ok"
+        return result
+    except Exception as e:
+        result = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        try:
+            append_metrics(METRICS_LOG_PATH, run_metrics.snapshot(
+                status=status, result=result, ai_cache=ai_cache.stats(since=cache_before)))
+        except Exception as e:
+            print(f"⚠️ Could not write run metrics: {e}")
+
+def _collect_media_data(force_refresh, feeds):
+    if not feeds:
+        return "No feeds due for polling."
+    df, feed_state = fetch_rss(force_refresh=force_refresh, feeds=feeds)
+    run_metrics.incr("articles.fetched", len(df))
+    if df.empty:
+        save_feed_state(feed_state)
+        return "No new articles in the RSS feeds."
+
+    fetched = len(df)
+    with run_metrics.stage("dedup"):
+        df, duplicates = dedup_articles(df)
+    run_metrics.incr("articles.new", len(df))
+    run_metrics.incr("articles.duplicates", len(duplicates))
+    print(f"🧹 {len(df)} new articles to classify, {len(duplicates)} near-duplicates, "
+          f"{fetched - len(df) - len(duplicates)} already seen")
+    if df.empty and duplicates.empty:
+        save_feed_state(feed_state)
+        return f"✅ Fetched {fetched} articles, nothing new since the last run."
+
+    if not df.empty:
+        df = enrich_articles(df)
+    df = pd.concat([df, inherit_enrichment(duplicates, df)], ignore_index=True)
     df["Collected At"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-    df_final = df[
-        ["Platform", "Content", "Link", "Date", "All Themes", "Sentiment", "Media Sector Impact", "Collected At"]
-    ]
-    upload_to_gsheet(df_final, sheet_title="Results")
+    with run_metrics.stage("store"):
+        stored = store.append(df)
+        seen_index.add(df)
+    run_metrics.incr("articles.stored", stored)
+    save_feed_state(feed_state)  # watermarks advance only once the articles are stored
+    print(f"💾 Stored {stored} new rows (total {store.count()} records).")
+    df_final = df[RESULT_COLUMNS]
+
+    mirrored = ""
+    if sheets_mirror_enabled():
+        try:
+            appended = upload_to_gsheet(df_final, sheet_title="Results")
+            mirrored = f", mirrored {appended} to Google Sheets"
+        except Exception as e:
+            print(f"⚠️ Google Sheets mirror failed: {e}")
+            run_metrics.incr("sheets.errors")
+            mirrored = " (Google Sheets mirror failed)"
+    print(f"🧠 AI cache: {ai_cache.stats()}")
 
-    return f"✅ Collected and uploaded {len(df_final)} articles successfully."
+    return f"✅ Collected {len(df_final)} articles, stored {stored} new rows{mirrored}."
@@ -0,0 +1,86 @@
+# ===============================================
+# 🟣 MCT Media Monitoring — Run Metrics
+# (stage timings, feed health, AI + Sheets usage per run)
+# ===============================================
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+
+class RunMetrics:
+    """Thread-safe metrics for one collection run.
+
+    - ``stage(name)`` times a block (repeated blocks add up)
+    - ``incr(name, n)`` bumps a counter, e.g. "ai.requests" or "sheets.calls"
+    - ``feed(...)`` records one feed's fetch outcome
+
+    ``snapshot()`` returns everything as one JSON-ready dict.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.started_at = datetime.now()
+            self._started = time.perf_counter()
+            self.stages = {}
+            self.counters = {}
+            self.feeds = []
+
+    @contextmanager
+    def stage(self, name):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - started
+            with self._lock:
+                self.stages[name] = self.stages.get(name, 0.0) + seconds
+
+    def incr(self, name, value=1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def count(self, name):
+        with self._lock:
+            return self.counters.get(name, 0)
+
+    def feed(self, url, source, status, latency, error, entries, new_entries):
+        with self._lock:
+            self.feeds.append({
+                "url": url, "source": source, "status": status, "latency": latency,
+                "error": error, "entries": entries, "new_entries": new_entries,
+            })
+
+    def snapshot(self, **extra):
+        with self._lock:
+            return {
+                "started_at": self.started_at.strftime("%Y-%m-%d %H:%M:%S"),
+                "duration": round(time.perf_counter() - self._started, 3),
+                "stages": {name: round(s, 3) for name, s in self.stages.items()},
+                "counters": dict(self.counters),
+                "feeds": list(self.feeds),
+                **extra,
+            }
+
+
+def append_metrics(path, entry):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+
+def read_metrics(path, limit=50):
+    """Most recent runs first."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            lines = f.readlines()[-limit:]
+    except FileNotFoundError:
+        return []
+    return [json.loads(line) for line in reversed(lines) if line.strip()]
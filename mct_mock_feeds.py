@@ -0,0 +1,144 @@
+# ===============================================
+# 🟣 MCT Media Monitoring — Mock RSS Feeds
+# (offline stand-in for the news sites' RSS endpoints)
+# ===============================================
+#
+# Usage:
+#   python mct_mock_feeds.py --feeds 50 --items 200 --latency 0.3
+#
+# Feeds are served at http://127.0.0.1:<port>/feed/<n>.xml with ETag and
+# Last-Modified, and answer conditional requests with 304.
+
+import argparse
+import hashlib
+import random
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from html import escape
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+SWAHILI_WORDS = (
+    "serikali wananchi leo rais mkutano mji biashara kilimo afya elimu shule maji barabara "
+    "mradi bunge mkoa wilaya polisi mahakama soko bei mafuta umeme mvua wakulima vijana"
+).split()
+ENGLISH_WORDS = (
+    "the government said on monday that officials police football club match music "
+    "festival weather rain market prices budget parliament hospital school project"
+).split()
+PLACES = ["Dar es Salaam", "Dodoma", "Arusha", "Zanzibar", "Mwanza", "Mbeya", "Tanga", "Kigoma"]
+
+# Phrases the keyword matcher (and the mock OpenAI rules) react to
+THEME_PHRASES = [
+    "uhuru wa habari", "kufungiwa gazeti", "mwandishi wa habari", "tume ya maadili",
+    "mapato ya matangazo", "uchaguzi mkuu", "kampeni za chuki", "haki za binadamu",
+]
+AI_ONLY_PHRASES = ["press freedom", "journalist", "election", "corruption", "advertising", "citizens"]
+
+# Markup shaped like what WordPress / Drupal feeds send
+SUMMARY_TEMPLATES = [
+    "<p>{text}&#8230;</p><p>The post <a href=\"{link}\" rel=\"nofollow\">{title}</a> appeared first on "
+    "<a href=\"https://example.tz\" rel=\"nofollow\">example.tz</a>.</p>",
+    "<img width=\"300\" height=\"200\" src=\"https://example.tz/a.jpg\" class=\"wp-post-image\" />{text}",
+    "<div class=\"field-item\"><strong>{place}:</strong> {text}</div>",
+    "{text}",
+]
+
+
+def synthetic_item(feed_no, item_no, rng, published):
+    """One RSS <item>; a third carry a theme phrase, a third an English-only hint."""
+    words = SWAHILI_WORDS if rng.random() < 0.7 else ENGLISH_WORDS
+    body = [rng.choice(words) for _ in range(rng.randint(20, 60))]
+    kind = item_no % 3
+    if kind == 0:
+        body.insert(rng.randrange(len(body)), rng.choice(THEME_PHRASES))
+    elif kind == 1:
+        body.insert(rng.randrange(len(body)), rng.choice(AI_ONLY_PHRASES))
+    text = " ".join(body)
+    title = " ".join(body[:8]).capitalize()
+    link = f"https://feed{feed_no}.example.tz/habari/{item_no}"
+    summary = rng.choice(SUMMARY_TEMPLATES).format(text=text, link=link, title=title, place=rng.choice(PLACES))
+    return (
+        f"<item><title>{escape(title)}</title><link>{link}</link>"
+        f"<guid isPermaLink=\"true\">{link}</guid>"
+        f"<pubDate>{format_datetime(published)}</pubDate>"
+        f"<description>{escape(summary)}</description></item>"
+    )
+
+
+def synthetic_feed(feed_no, items, seed=42, now=None):
+    """RSS 2.0 document with ``items`` entries, newest first, one every 10 minutes."""
+    rng = random.Random(seed * 100_003 + feed_no)
+    now = now or datetime(2025, 10, 1, 12, 0, tzinfo=timezone.utc)
+    entries = "".join(
+        synthetic_item(feed_no, i, rng, now - timedelta(minutes=10 * i)) for i in range(items)
+    )
+    return (
+        "<?xml version=\"1.0\" encoding=\"UTF-8\"?><rss version=\"2.0\"><channel>"
+        f"<title>Mock Source {feed_no}</title><link>https://feed{feed_no}.example.tz</link>"
+        f"<description>Synthetic feed {feed_no}</description>{entries}</channel></rss>"
+    ).encode("utf-8")
+
+
+class MockFeedHandler(BaseHTTPRequestHandler):
+    feeds = {}  # path -> (body, etag, last_modified)
+    latency = 0.0
+    requests = 0
+    _lock = threading.Lock()
+
+    def do_GET(self):
+        with self._lock:
+            type(self).requests += 1
+        feed = self.feeds.get(self.path)
+        time.sleep(self.latency)
+        if feed is None:
+            self.send_error(404)
+            return
+        body, etag, modified = feed
+        if self.headers.get("If-None-Match") == etag or self.headers.get("If-Modified-Since") == modified:
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/rss+xml; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.send_header("Last-Modified", modified)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, fmt, *args):
+        pass
+
+
+def start_mock_feeds(feeds=10, items=100, latency=0.0, port=0, seed=42):
+    """Start the feed server on a background thread; returns (server, feed_urls)."""
+    modified = format_datetime(datetime(2025, 10, 1, 12, 0, tzinfo=timezone.utc), usegmt=True)
+    documents = {}
+    for n in range(feeds):
+        body = synthetic_feed(n, items, seed)
+        documents[f"/feed/{n}.xml"] = (body, f"\"{hashlib.md5(body).hexdigest()}\"", modified)
+    handler = type("Handler", (MockFeedHandler,), {"feeds": documents, "latency": latency, "requests": 0})
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    return server, [f"{base}/feed/{n}.xml" for n in range(feeds)]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Mock RSS feed server")
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--feeds", type=int, default=50)
+    parser.add_argument("--items", type=int, default=100, help="entries per feed")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    args = parser.parse_args()
+
+    server, urls = start_mock_feeds(args.feeds, args.items, args.latency, args.port)
+    print(f"🧪 {len(urls)} mock feeds on {urls[0].rsplit('/', 2)[0]}/feed/<0..{len(urls) - 1}>.xml")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
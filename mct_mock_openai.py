@@ -0,0 +1,122 @@
+# ===============================================
+# 🟣 MCT Media Monitoring — Mock OpenAI Server
+# (offline stand-in for /v1/chat/completions)
+# ===============================================
+#
+# Usage:
+#   python mct_mock_openai.py --port 8765 --latency 0.2
+#   OPENAI_BASE_URL=http://127.0.0.1:8765/v1 OPENAI_API_KEY=test streamlit run dashboard.py
+
+import argparse
+import json
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from mct_ai_batch import AI_THEMES
+
+# Deterministic keyword rules so offline runs give stable, checkable answers
+MOCK_RULES = {
+    "Media Freedom": ["press freedom", "media law", "uhuru wa habari", "gazeti"],
+    "Journalist Safety": ["journalist", "mwandishi", "reporter"],
+    "Media Economy": ["advertising", "matangazo", "revenue"],
+    "Violations & Complaints": ["complaint", "malalamiko", "fake news"],
+    "Political Bias": ["election", "uchaguzi", "campaign", "kampeni"],
+    "Public Sentiment": ["citizens", "wananchi", "opinion"],
+    "Social & Human Rights Issues": ["human rights", "haki", "corruption", "rushwa"],
+    "Analytics & AI Monitoring": ["data", "analytics", "takwimu"],
+}
+
+
+def mock_themes(text):
+    text = str(text).lower()
+    return [theme for theme in AI_THEMES if any(kw in text for kw in MOCK_RULES[theme])]
+
+
+def mock_completion(prompt):
+    """Answer a batch prompt with {"results": {...}}, or a plain prompt with a CSV list."""
+    match = re.search(r"Articles \(JSON\):\s*(\[.*\])", prompt, re.S)
+    if match:
+        articles = json.loads(match.group(1))
+        return json.dumps({"results": {a["id"]: mock_themes(a["text"]) for a in articles}})
+    return ", ".join(mock_themes(prompt.rsplit("Text:", 1)[-1]))
+
+
+class MockOpenAIHandler(BaseHTTPRequestHandler):
+    latency = 0.0
+    failure_rate = 0.0
+    calls = 0
+    _lock = threading.Lock()
+
+    def do_POST(self):
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            self.send_error(404)
+            return
+        with self._lock:
+            type(self).calls += 1
+            call_no = type(self).calls
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+        time.sleep(self.latency)
+
+        # Every Nth call is rejected with 429 to exercise client backoff
+        if self.failure_rate and call_no % max(1, round(1 / self.failure_rate)) == 0:
+            self._send_json(429, {"error": {"message": "Rate limit reached (mock)", "type": "rate_limit"}})
+            return
+
+        prompt = "\n".join(m.get("content", "") for m in body.get("messages", []))
+        content = mock_completion(prompt)
+        prompt_tokens = len(prompt) // 4
+        completion_tokens = len(content) // 4
+        self._send_json(200, {
+            "id": f"chatcmpl-mock-{uuid.uuid4().hex[:12]}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "mock"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop",
+            }],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        })
+
+    def _send_json(self, status, payload):
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, fmt, *args):
+        pass
+
+
+def start_mock_openai(port=0, latency=0.0, failure_rate=0.0):
+    """Start the mock server on a background thread; returns (server, base_url)."""
+    handler = type("Handler", (MockOpenAIHandler,), {"latency": latency, "failure_rate": failure_rate, "calls": 0})
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/v1"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Mock OpenAI-compatible chat.completions server")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="fraction of calls answered with 429")
+    args = parser.parse_args()
+
+    server, base_url = start_mock_openai(args.port, args.latency, args.failure_rate)
+    print(f"🧪 Mock OpenAI listening on {base_url}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
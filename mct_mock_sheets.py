@@ -0,0 +1,83 @@
+# ===============================================
+# 🟣 MCT Media Monitoring — Fake Google Sheets
+# (in-memory stand-in for the gspread calls the collector makes)
+# ===============================================
+
+import threading
+import time
+
+
+class FakeWorksheet:
+    """The subset of gspread.Worksheet used by upload_to_gsheet and the dashboard.
+
+    Every call sleeps ``latency`` seconds (one API round trip) and is counted
+    in ``calls``, so benchmarks can report Sheets traffic.
+    """
+
+    def __init__(self, title, latency=0.0):
+        self.title = title
+        self.latency = latency
+        self.rows = []
+        self.calls = {}
+        self._lock = threading.Lock()
+
+    def _call(self, name):
+        with self._lock:
+            self.calls[name] = self.calls.get(name, 0) + 1
+        time.sleep(self.latency)
+
+    def row_values(self, row):
+        self._call("row_values")
+        return list(self.rows[row - 1]) if row <= len(self.rows) else []
+
+    def col_values(self, col):
+        self._call("col_values")
+        return [r[col - 1] if col <= len(r) else "" for r in self.rows]
+
+    def append_row(self, values, value_input_option=None, table_range=None):
+        self._call("append_row")
+        self.rows.append([str(v) for v in values])
+
+    def append_rows(self, values, value_input_option=None, table_range=None):
+        self._call("append_rows")
+        self.rows.extend([str(v) for v in row] for row in values)
+
+    def get_all_records(self):
+        self._call("get_all_records")
+        if not self.rows:
+            return []
+        header = self.rows[0]
+        return [dict(zip(header, row)) for row in self.rows[1:]]
+
+
+class FakeSpreadsheet:
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.worksheets = {}
+
+    def worksheet(self, title):
+        import gspread
+        if title not in self.worksheets:
+            raise gspread.exceptions.WorksheetNotFound(title)
+        return self.worksheets[title]
+
+    def add_worksheet(self, title, rows=1000, cols=26):
+        return self.worksheets.setdefault(title, FakeWorksheet(title, self.latency))
+
+
+class FakeSheetsClient:
+    """Drop-in for the authorized gspread client: open_by_key() returns one shared spreadsheet."""
+
+    def __init__(self, latency=0.0):
+        self.spreadsheet = FakeSpreadsheet(latency)
+
+    def open_by_key(self, key):
+        return self.spreadsheet
+
+    def calls(self):
+        """API calls made so far, summed over all worksheets."""
+        totals = {}
+        for ws in self.spreadsheet.worksheets.values():
+            for name, count in ws.calls.items():
+                totals[name] = totals.get(name, 0) + count
+        return totals
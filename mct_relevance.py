@@ -0,0 +1,134 @@
+# ===============================================
+# 🟣 MCT Media Monitoring — Local Relevance Model
+# (TF-IDF + logistic regression, trained on past theme labels)
+# ===============================================
+#
+# A cheap first pass before OpenAI: articles the model is confident are
+# off-topic for the media sector (sport, music, celebrity news...) are not
+# sent to the AI at all. Pure numpy; the sparse TF-IDF matrix is kept as
+# CSR arrays (indptr, indices, data).
+
+import json
+import re
+from datetime import datetime
+
+import numpy as np
+
+_TOKEN_RE = re.compile(r"\w\w+")
+
+
+def tokenize(text):
+    """Lowercase word unigrams and bigrams."""
+    words = _TOKEN_RE.findall(str(text).lower())
+    return words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+
+
+def _csr(token_lists, vocab):
+    """CSR arrays of raw term counts over ``vocab``; unknown tokens are dropped."""
+    indptr, indices, data = [0], [], []
+    for tokens in token_lists:
+        ids = [vocab[t] for t in tokens if t in vocab]
+        if ids:
+            uniq, counts = np.unique(ids, return_counts=True)
+            indices.append(uniq)
+            data.append(counts)
+        indptr.append(indptr[-1] + (len(uniq) if ids else 0))
+    indices = np.concatenate(indices) if indices else np.zeros(0, dtype=np.int64)
+    data = np.concatenate(data).astype(np.float64) if data else np.zeros(0)
+    return np.asarray(indptr, dtype=np.int64), indices.astype(np.int64), data
+
+
+def _row_sums(indptr, values):
+    """Sum of ``values`` within each CSR row (empty rows give 0)."""
+    sums = np.add.reduceat(values, indptr[:-1]) if len(values) else np.zeros(len(indptr) - 1)
+    sums[indptr[:-1] == indptr[1:]] = 0.0  # reduceat repeats the next value for empty rows
+    return sums
+
+
+class RelevanceModel:
+    """Binary relevant / off-topic classifier over TF-IDF features.
+
+    ``train`` fits it on article texts and 0/1 labels; ``predict`` returns
+    the probability that each text is relevant to the media sector.
+    """
+
+    def __init__(self, vocab, idf, weights, bias, meta=None):
+        self.vocab = {term: i for i, term in enumerate(vocab)}
+        self.terms = list(vocab)
+        self.idf = np.asarray(idf, dtype=np.float64)
+        self.weights = np.asarray(weights, dtype=np.float64)
+        self.bias = float(bias)
+        self.meta = meta or {}
+
+    def _tfidf(self, token_lists):
+        indptr, indices, data = _csr(token_lists, self.vocab)
+        data = (1 + np.log(data)) * self.idf[indices]  # sublinear tf
+        norms = np.sqrt(_row_sums(indptr, data ** 2))
+        data /= np.repeat(np.where(norms > 0, norms, 1.0), np.diff(indptr))
+        return indptr, indices, data
+
+    def predict(self, texts):
+        indptr, indices, data = self._tfidf([tokenize(t) for t in texts])
+        logits = _row_sums(indptr, data * self.weights[indices]) + self.bias
+        return 1 / (1 + np.exp(-logits))
+
+    @classmethod
+    def train(cls, texts, labels, max_features=50_000, min_df=3, epochs=300,
+              learning_rate=0.5, l2=1e-5):
+        """Fit on ``texts`` with 0/1 ``labels`` (classes weighted to balance)."""
+        labels = np.asarray(labels, dtype=np.float64)
+        token_lists = [tokenize(t) for t in texts]
+
+        df_counts = {}
+        for tokens in token_lists:
+            for term in set(tokens):
+                df_counts[term] = df_counts.get(term, 0) + 1
+        terms = sorted((t for t, n in df_counts.items() if n >= min_df), key=lambda t: -df_counts[t])
+        terms = sorted(terms[:max_features])
+        n_docs = len(token_lists)
+        idf = np.log((1 + n_docs) / (1 + np.array([df_counts[t] for t in terms], dtype=np.float64))) + 1
+
+        model = cls(terms, idf, np.zeros(len(terms)), 0.0)
+        indptr, indices, data = model._tfidf(token_lists)
+        row_lengths = np.diff(indptr)
+
+        positives = labels.sum()
+        sample_weight = np.where(labels == 1, n_docs / (2 * max(positives, 1)),
+                                 n_docs / (2 * max(n_docs - positives, 1)))
+        # Full-batch gradient descent with Adam; every step is a few
+        # vectorized passes over the non-zero entries
+        w, b = model.weights, 0.0
+        m_w, v_w, m_b, v_b = np.zeros_like(w), np.zeros_like(w), 0.0, 0.0
+        beta1, beta2, eps = 0.9, 0.999, 1e-8
+        for step in range(1, epochs + 1):
+            p = 1 / (1 + np.exp(-(_row_sums(indptr, data * w[indices]) + b)))
+            error = (p - labels) * sample_weight / n_docs
+            grad_w = np.bincount(indices, weights=data * np.repeat(error, row_lengths), minlength=len(w)) + l2 * w
+            grad_b = error.sum()
+            m_w = beta1 * m_w + (1 - beta1) * grad_w
+            v_w = beta2 * v_w + (1 - beta2) * grad_w ** 2
+            m_b = beta1 * m_b + (1 - beta1) * grad_b
+            v_b = beta2 * v_b + (1 - beta2) * grad_b ** 2
+            w -= learning_rate * (m_w / (1 - beta1 ** step)) / (np.sqrt(v_w / (1 - beta2 ** step)) + eps)
+            b -= learning_rate * (m_b / (1 - beta1 ** step)) / (np.sqrt(v_b / (1 - beta2 ** step)) + eps)
+
+        model.weights, model.bias = w, b
+        model.meta = {
+            "trained_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "samples": n_docs,
+            "positives": int(positives),
+            "features": len(terms),
+        }
+        return model
+
+    def save(self, path):
+        with open(path, "wb") as f:  # a file object, so numpy keeps the name as given
+            np.savez_compressed(
+                f, terms=np.array(self.terms, dtype=str), idf=self.idf, weights=self.weights,
+                bias=np.array(self.bias), meta=np.array(json.dumps(self.meta)),
+            )
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as z:
+            return cls(z["terms"].tolist(), z["idf"], z["weights"], z["bias"], json.loads(str(z["meta"])))
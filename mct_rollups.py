@@ -0,0 +1,61 @@
+# ===============================================
+# 🟣 MCT Media Monitoring — Time-series Rollups
+# (article counts by day/week x platform x theme x sentiment x impact)
+# ===============================================
+
+import pandas as pd
+
+from mct_theme_index import NO_THEME, split_themes
+
+GRAINS = ("day", "week")
+DIMENSIONS = ["Platform", "Theme", "Sentiment", "Media Sector Impact"]
+ROLLUP_COLUMNS = ["Grain", "Period"] + DIMENSIONS + ["Articles"]
+
+# Theme value of the per-article total rows. Every other Theme row counts
+# articles carrying that theme, so an article with two themes is in two of
+# them; sum the ALL_THEMES rows (never the theme rows) to count articles.
+ALL_THEMES = ""
+
+
+def period_start(dates, grain):
+    """Start of the day, or of the ISO week (Monday), for each date."""
+    days = dates.dt.floor("D")
+    if grain == "day":
+        return days
+    if grain == "week":
+        return days - pd.to_timedelta(days.dt.dayofweek, unit="D")
+    raise ValueError(f"Unknown rollup grain '{grain}' (choose from {GRAINS})")
+
+
+def build_rollups(df, grains=GRAINS):
+    """Rollup rows (ROLLUP_COLUMNS) for row-level articles with a datetime "Date".
+
+    Rows without a date are left out. Missing dimension values become "".
+    """
+    df = df[df["Date"].notna()]
+    if df.empty:
+        return pd.DataFrame(columns=ROLLUP_COLUMNS).astype({"Period": "datetime64[ns]", "Articles": "int64"})
+
+    dims = pd.DataFrame({
+        col: df[col].astype(object).fillna("").to_numpy()
+        for col in ["Platform", "Sentiment", "Media Sector Impact"]
+    })
+    dims["Date"] = df["Date"].to_numpy()
+    # Each distinct "All Themes" string is split once
+    themes = df["All Themes"].astype(object)
+    split = {v: sorted(split_themes(v)) or [NO_THEME] for v in themes.dropna().unique()}
+    dims["Theme"] = themes.map(split).map(lambda t: t if isinstance(t, list) else [NO_THEME]).to_numpy()
+    per_theme = dims.explode("Theme")
+    totals = dims.assign(Theme=ALL_THEMES)
+
+    frames = []
+    for grain in grains:
+        for part in (totals, per_theme):
+            counts = (
+                part.assign(Period=period_start(part["Date"], grain))
+                .groupby(["Period"] + DIMENSIONS, observed=True)
+                .size()
+                .reset_index(name="Articles")
+            )
+            frames.append(counts.assign(Grain=grain))
+    return pd.concat(frames, ignore_index=True)[ROLLUP_COLUMNS]
@@ -0,0 +1,134 @@
+# ===============================================
+# 🟣 MCT Media Monitoring — Adaptive Feed Scheduler
+# (per-feed polling intervals learned from each feed's publish rate)
+# ===============================================
+#
+# Feeds and scheduling bounds live in feeds.json:
+#
+#   {
+#     "schedule": {"min_interval": 10, "max_interval": 180, ...},
+#     "feeds": [
+#       {"url": "https://millardayo.com/feed/"},
+#       {"url": "https://sautikubwa.org/feed/", "max_interval": 720},
+#       {"url": "https://example.tz/feed/", "enabled": false}
+#     ]
+#   }
+#
+# Any "schedule" setting can be overridden per feed. Intervals are minutes.
+#
+# After every poll a feed's publish rate (items/hour, smoothed across polls)
+# sets its next interval: busy feeds are polled often, quiet ones rarely.
+# Failing feeds back off exponentially, and every interval gets random
+# jitter so polls spread out instead of all hitting at once.
+
+import json
+import os
+import random
+import time
+
+# Checked in next to the code; MCT_FEEDS_CONFIG points elsewhere
+FEEDS_CONFIG_PATH = os.environ.get(
+    "MCT_FEEDS_CONFIG", os.path.join(os.path.dirname(os.path.abspath(__file__)), "feeds.json")
+)
+
+SCHEDULE_DEFAULTS = {
+    "min_interval": 10,  # minutes; floor for the busiest feeds
+    "max_interval": 180,  # minutes; ceiling for quiet feeds
+    "target_new_items": 0.5,  # new items a poll should find on average (<1 favours freshness)
+    "max_backoff": 1440,  # minutes; ceiling while a feed keeps failing
+    "jitter": 0.15,  # +/- fraction added to every interval
+    "rate_window": 168,  # hours of publish times used to estimate the rate
+    "smoothing": 0.3,  # weight of the newest rate estimate
+}
+
+
+def load_feeds_config(path=FEEDS_CONFIG_PATH):
+    """Enabled feeds as dicts of url + effective schedule settings, in file order."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            config = json.load(f)
+    except FileNotFoundError:
+        print(f"⚠️ Feed config '{path}' not found; no feeds will be polled.")
+        return []
+    defaults = {**SCHEDULE_DEFAULTS, **config.get("schedule", {})}
+    feeds = []
+    for feed in config.get("feeds", []):
+        if isinstance(feed, str):
+            feed = {"url": feed}
+        if feed.get("enabled", True):
+            feeds.append({**defaults, **feed})
+    return feeds
+
+
+def estimate_publish_rate(timestamps, now, window_hours):
+    """Items per hour from the publish times a feed lists, or None.
+
+    Only times within the window (and not in the future) count; the rate is
+    the gaps between them averaged, so a feed listing its last 10 items
+    over 5 hours publishes about 1.8 an hour.
+    """
+    recent = sorted(ts for ts in timestamps if now - window_hours * 3600 <= ts <= now)
+    if len(recent) < 2 or recent[-1] == recent[0]:
+        return None
+    return (len(recent) - 1) / ((recent[-1] - recent[0]) / 3600)
+
+
+def schedule_next(schedule, settings, now, ok, timestamps=(), new_entries=0, rng=random):
+    """Updated schedule dict for a feed that was just polled.
+
+    ``schedule`` is the feed's previous schedule (empty on the first poll)
+    and ``settings`` its effective config. On success the publish rate is
+    re-estimated, from the listed publish times or else from the new items
+    found since the last poll. On failure the interval doubles per
+    consecutive failure, up to max_backoff.
+    """
+    schedule = dict(schedule or {})
+    rate = schedule.get("rate")
+    if ok:
+        observed = estimate_publish_rate(timestamps, now, settings["rate_window"])
+        last_poll = schedule.get("last_poll_ts")
+        if observed is None and last_poll and now > last_poll:
+            observed = new_entries / ((now - last_poll) / 3600)
+        if observed is not None:
+            alpha = settings["smoothing"]
+            rate = observed if rate is None else alpha * observed + (1 - alpha) * rate
+        schedule["failures"] = 0
+        if rate:
+            interval = 60 * settings["target_new_items"] / rate
+        else:  # nothing published yet, or nothing known: quiet until proven busy
+            interval = settings["max_interval"] if rate == 0 else settings["min_interval"]
+        low, high = settings["min_interval"], settings["max_interval"]
+        schedule["base_interval"] = round(min(high, max(low, interval)), 2)
+    else:
+        schedule["failures"] = schedule.get("failures", 0) + 1
+        base = schedule.get("base_interval", settings["min_interval"])
+        interval = base * 2 ** schedule["failures"]
+        low, high = settings["min_interval"], settings["max_backoff"]
+
+    # Jitter first, then clamp, so the bounds hold exactly
+    interval *= 1 + settings["jitter"] * rng.uniform(-1, 1)
+    interval = min(high, max(low, interval))
+    next_poll = now + interval * 60
+    schedule.update({
+        "rate": round(rate, 4) if rate is not None else None,
+        "interval": round(interval, 2),
+        "last_poll_ts": now,
+        "next_poll_ts": next_poll,
+        "next_poll": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(next_poll)),
+    })
+    return schedule
+
+
+def due_feeds(feeds, feed_state, now=None):
+    """URLs of the feeds whose next poll time has come (never-polled feeds are due)."""
+    now = time.time() if now is None else now
+    return [
+        f["url"] for f in feeds
+        if feed_state.get(f["url"], {}).get("schedule", {}).get("next_poll_ts", 0) <= now
+    ]
+
+
+def next_due_ts(feeds, feed_state):
+    """Epoch seconds of the earliest scheduled poll, or None without feeds."""
+    times = [feed_state.get(f["url"], {}).get("schedule", {}).get("next_poll_ts", 0) for f in feeds]
+    return min(times) if times else None
@@ -0,0 +1,49 @@
+# ===============================================
+# 🟣 MCT Media Monitoring — Full-text Search
+# (Swahili-aware normalization + FTS5 query builder)
+# ===============================================
+
+import re
+import unicodedata
+
+# unicode61 folds case and diacritics; "'" is kept inside words so Swahili
+# ng'ombe / ng'ambo stay one token instead of "ng" + "ombe"
+FTS_TOKENIZE = "unicode61 remove_diacritics 2 tokenchars ''''"
+
+_APOSTROPHES = str.maketrans({"’": "'", "‘": "'", "`": "'", "ʼ": "'", "´": "'"})
+_QUERY_RE = re.compile(r'"([^"]*)"|(\S+)')
+_WORD_RE = re.compile(r"[\w']+")
+
+
+def normalize_search_text(text):
+    """Text as it is indexed and queried: NFKC, lowercase, one apostrophe."""
+    return unicodedata.normalize("NFKC", str(text)).translate(_APOSTROPHES).lower()
+
+
+def build_fts_query(query, prefix=True):
+    """FTS5 MATCH expression for a search box query, or None if it has no words.
+
+    "quoted text" is a phrase; other words must all appear (``OR`` between
+    two words relaxes that). With ``prefix``, bare words also match longer
+    forms, which covers Swahili suffixes: gazeti → gazetini, fungiwa → fungiwaji.
+    A trailing ``*`` asks for that explicitly.
+    """
+    parts = []
+    for phrase, word in _QUERY_RE.findall(query or ""):
+        if word == "OR":
+            if parts and parts[-1] != "OR":
+                parts.append("OR")
+            continue
+        tokens = _WORD_RE.findall(normalize_search_text(phrase or word))
+        tokens = [t.strip("'") for t in tokens if t.strip("'")]
+        if not tokens:
+            continue
+        quoted = '"' + " ".join(tokens) + '"'
+        if phrase:
+            parts.append(quoted)
+        else:
+            # A bare word that splits (e.g. "uhuru-wa") is matched as a phrase
+            parts.append(quoted + "*" if prefix or word.endswith("*") else quoted)
+    while parts and parts[-1] == "OR":
+        parts.pop()
+    return " ".join(parts) or None
@@ -0,0 +1,198 @@
+# ===============================================
+# 🟣 MCT Media Monitoring — Sentiment Engines
+# (Swahili + English lexicon, batch API, hash cache)
+# ===============================================
+
+import hashlib
+import re
+
+import numpy as np
+import pandas as pd
+from cachetools import LRUCache
+
+# Whole-word entries (English and Swahili nouns/adjectives), polarity in [-1, 1]
+WORD_LEXICON = {
+    # --- Swahili, positive
+    "nzuri": 0.6, "vizuri": 0.6, "bora": 0.5, "safi": 0.4, "furaha": 0.8, "amani": 0.5,
+    "mafanikio": 0.7, "maendeleo": 0.5, "ushindi": 0.7, "mshindi": 0.6, "washindi": 0.6,
+    "bingwa": 0.5, "pongezi": 0.7, "hongera": 0.8, "shukrani": 0.6, "asante": 0.5,
+    "upendo": 0.6, "imara": 0.4, "salama": 0.4, "usalama": 0.3, "faida": 0.5, "neema": 0.5,
+    "baraka": 0.5, "tumaini": 0.5, "matumaini": 0.5, "ustawi": 0.6, "ufanisi": 0.5,
+    "utulivu": 0.4, "msaada": 0.4, "misaada": 0.4, "tuzo": 0.6, "nafuu": 0.3, "ajira": 0.3,
+    "uwekezaji": 0.3, "mshikamano": 0.5, "heshima": 0.4, "fahari": 0.6, "shangwe": 0.7,
+    # --- Swahili, negative
+    "vita": -0.6, "ajali": -0.7, "kifo": -0.8, "vifo": -0.8, "rushwa": -0.7, "ufisadi": -0.8,
+    "hasira": -0.6, "huzuni": -0.7, "hofu": -0.6, "tatizo": -0.5, "matatizo": -0.5,
+    "changamoto": -0.3, "mgogoro": -0.6, "migogoro": -0.6, "ghasia": -0.7, "vurugu": -0.7,
+    "uhalifu": -0.7, "wizi": -0.6, "umaskini": -0.6, "njaa": -0.6, "ukame": -0.5,
+    "mafuriko": -0.6, "janga": -0.7, "maafa": -0.8, "hatari": -0.5, "ubaguzi": -0.6,
+    "unyanyasaji": -0.7, "ukatili": -0.8, "dhuluma": -0.7, "uonevu": -0.6, "kashfa": -0.6,
+    "uongo": -0.5, "ugonjwa": -0.5, "hasara": -0.6, "madeni": -0.4, "mbaya": -0.6,
+    "vibaya": -0.6, "ukosefu": -0.4, "upungufu": -0.4, "malalamiko": -0.4, "tishio": -0.6,
+    "vitisho": -0.6, "mauaji": -0.9, "majeruhi": -0.6, "waathirika": -0.5, "udhalilishaji": -0.7,
+    "ukandamizaji": -0.7, "marufuku": -0.5, "msiba": -0.7, "uchochezi": -0.5, "chuki": -0.7,
+    # --- English, positive
+    "good": 0.7, "great": 0.8, "excellent": 0.9, "success": 0.7, "successful": 0.7,
+    "win": 0.6, "wins": 0.6, "won": 0.5, "victory": 0.7, "celebrate": 0.6, "celebrated": 0.6,
+    "praise": 0.6, "praised": 0.6, "welcome": 0.5, "welcomed": 0.5, "peace": 0.5,
+    "peaceful": 0.5, "growth": 0.4, "improve": 0.5, "improved": 0.5, "boost": 0.5,
+    "benefit": 0.5, "progress": 0.5, "hope": 0.4, "happy": 0.8, "safe": 0.4, "award": 0.6,
+    "positive": 0.5, "strong": 0.4, "achieve": 0.6, "achievement": 0.6, "support": 0.3,
+    "freedom": 0.3, "commend": 0.6, "commended": 0.6,
+    # --- English, negative
+    "bad": -0.7, "crisis": -0.7, "attack": -0.7, "attacked": -0.7, "killed": -0.9,
+    "kill": -0.8, "death": -0.8, "dead": -0.8, "arrest": -0.5, "arrested": -0.5,
+    "detained": -0.5, "abducted": -0.8, "violence": -0.8, "corruption": -0.7, "fraud": -0.7,
+    "scandal": -0.6, "protest": -0.4, "conflict": -0.6, "war": -0.8, "ban": -0.5,
+    "banned": -0.5, "suspended": -0.4, "threat": -0.6, "threatened": -0.6, "failure": -0.6,
+    "failed": -0.6, "fail": -0.6, "loss": -0.5, "losses": -0.5, "poor": -0.5, "poverty": -0.6,
+    "flood": -0.6, "floods": -0.6, "accident": -0.7, "injured": -0.6, "crash": -0.6,
+    "fear": -0.6, "concern": -0.3, "concerns": -0.3, "criticism": -0.4, "criticised": -0.4,
+    "criticized": -0.4, "condemn": -0.6, "condemned": -0.6, "harassment": -0.7,
+    "censorship": -0.6, "shutdown": -0.5, "decline": -0.4, "shortage": -0.5, "illegal": -0.5,
+    "abuse": -0.7, "victims": -0.6, "hate": -0.7, "fake": -0.5, "false": -0.4,
+}
+
+# Swahili verb stems, matched inside inflected verbs (walifurahi, amekamatwa),
+# see _VERB_RE. Longer stems win, so "shindwa" (fail) is not read as "shind" (win).
+STEM_LEXICON = {
+    "furahi": 0.8, "furahia": 0.8, "fanikiw": 0.7, "pongez": 0.7, "sherehek": 0.6,
+    "boresh": 0.5, "imarish": 0.4, "saidi": 0.4, "shind": 0.5, "penda": 0.5, "shukur": 0.6,
+    "endeleza": 0.4, "tekeleza": 0.2, "zindua": 0.3,
+    "shindwa": -0.6, "kamatw": -0.5, "uawa": -0.9, "jeruhi": -0.6, "shambuli": -0.7,
+    "tekwa": -0.7, "pigwa": -0.5, "lalamik": -0.4, "kosoa": -0.4, "laani": -0.6,
+    "fungiwa": -0.5, "filisi": -0.6, "poteza": -0.5, "haribu": -0.6, "ibiwa": -0.5,
+    "fariki": -0.7, "nyanyas": -0.7, "tesa": -0.7, "ogopa": -0.5, "chukia": -0.6,
+    "huzunik": -0.7, "sikitik": -0.5, "sikitisha": -0.6, "dhulumu": -0.7, "kandamiz": -0.7,
+}
+
+# Words that flip the polarity of the next scored word (within NEGATION_WINDOW tokens)
+NEGATORS = {"si", "sio", "siyo", "hakuna", "bila", "not", "no", "never", "without", "cannot"}
+NEGATION_WINDOW = 3
+
+# A stem only counts at the start of a verb, after the prefix slots
+# (negation, subject, tense, relative, object: "ha-wa-ku-furahi",
+# "a-li-ye-shind-a"), and before a verb ending. Nouns built on the same
+# stems (mashindano, ushindani, msaidizi) do not match. A "ha"/"si"
+# negation prefix flips the polarity ("hawakufurahi" = they were not happy).
+_VERB_PREFIXES = (
+    r"(?P<negated>ha|si)?"
+    r"(?:ni|u|a|tu|m|mu|wa|i|li|ya|ki|vi|zi|ku|pa|w|y|l|ch|vy|z|kw)?"
+    r"(?:na|li|ta|me|ki|nge|ngali|ku|hu|ka|sha|ja|a)?"
+    r"(?:ye|o|yo|cho|vyo|zo|lo|po|ko|mo)?"
+    r"(?:ni|ku|m|mw|tu|wa|ji|i|li|ya|ki|vi|zi|u)?"
+)
+_VERB_ENDINGS = r"(?:a|e|i|u|wa|we|ia|ie|iwa|ika|ike|ka|kwa|isha|ishe|ishwa|sha|shwa|ni|eni)?"
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+class SentimentEngine:
+    """Base class: subclasses implement score_batch(); labels use the thresholds."""
+
+    name = "base"
+
+    def __init__(self, positive_threshold=0.1, negative_threshold=-0.1):
+        self.positive_threshold = positive_threshold
+        self.negative_threshold = negative_threshold
+
+    def score_batch(self, texts):
+        raise NotImplementedError
+
+    def label_scores(self, scores):
+        scores = np.asarray(scores, dtype=float)
+        return np.select(
+            [scores > self.positive_threshold, scores < self.negative_threshold],
+            ["Positive", "Negative"],
+            default="Neutral",
+        )
+
+    def label_batch(self, texts):
+        return list(self.label_scores(self.score_batch(texts)))
+
+
+class LexiconSentimentEngine(SentimentEngine):
+    """Compiled Swahili + English lexicon scorer.
+
+    The score is the mean polarity of the words found, flipped after a
+    negator or inside a negative Swahili verb. Each distinct token is
+    resolved once, and texts are cached by content hash.
+    """
+
+    name = "lexicon"
+
+    def __init__(self, positive_threshold=0.1, negative_threshold=-0.1, cache_size=100_000):
+        super().__init__(positive_threshold, negative_threshold)
+        stems = sorted(STEM_LEXICON, key=len, reverse=True)
+        self._verb_re = re.compile(
+            f"{_VERB_PREFIXES}(?P<stem>{'|'.join(map(re.escape, stems))}){_VERB_ENDINGS}"
+        )
+        self._token_cache = {}
+        self._text_cache = LRUCache(maxsize=cache_size)
+
+    def _token_polarity(self, token):
+        """(polarity, negated_verb) for one lowercased token; cached per token."""
+        cached = self._token_cache.get(token)
+        if cached is not None:
+            return cached
+        if token in WORD_LEXICON:
+            result = (WORD_LEXICON[token], False)
+        else:
+            m = self._verb_re.fullmatch(token)
+            if m:
+                result = (STEM_LEXICON[m.group("stem")], m.group("negated") is not None)
+            else:
+                result = (0.0, False)
+        self._token_cache[token] = result
+        return result
+
+    def score(self, text):
+        key = hashlib.blake2b(str(text).encode("utf-8"), digest_size=16).digest()
+        cached = self._text_cache.get(key)
+        if cached is not None:
+            return cached
+
+        total, hits, negate_until = 0.0, 0, -1
+        for i, token in enumerate(_TOKEN_RE.findall(str(text).lower())):
+            if token in NEGATORS:
+                negate_until = i + NEGATION_WINDOW
+                continue
+            polarity, negated = self._token_polarity(token)
+            if polarity:
+                if negated != (i <= negate_until):
+                    polarity = -polarity
+                    negate_until = -1
+                total += polarity
+                hits += 1
+        result = total / hits if hits else 0.0
+        self._text_cache[key] = result
+        return result
+
+    def score_batch(self, texts):
+        texts = pd.Series(texts, dtype=object)
+        unique = texts.unique()
+        scores = dict(zip(unique, map(self.score, unique)))
+        return texts.map(scores).to_numpy(dtype=float)
+
+
+class TextBlobSentimentEngine(SentimentEngine):
+    """The original English-only TextBlob polarity, kept for comparison."""
+
+    name = "textblob"
+
+    def score_batch(self, texts):
+        from textblob import TextBlob
+        return np.array([TextBlob(str(t)).sentiment.polarity for t in texts], dtype=float)
+
+
+SENTIMENT_ENGINES = {
+    LexiconSentimentEngine.name: LexiconSentimentEngine,
+    TextBlobSentimentEngine.name: TextBlobSentimentEngine,
+}
+
+
+def get_sentiment_engine(name="lexicon", **kwargs):
+    try:
+        return SENTIMENT_ENGINES[name](**kwargs)
+    except KeyError:
+        raise ValueError(f"Unknown sentiment engine '{name}' (choose from {sorted(SENTIMENT_ENGINES)})")
@@ -0,0 +1,414 @@
+# ===============================================
+# 🟣 MCT Media Monitoring — Local Article Store
+# (SQLite system of record, Google Sheets = mirror)
+# ===============================================
+
+import os
+import sqlite3
+from contextlib import closing
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+
+import pandas as pd
+
+from mct_rollups import ROLLUP_COLUMNS, build_rollups
+from mct_search import FTS_TOKENIZE, build_fts_query, normalize_search_text
+
+RESULT_COLUMNS = [
+    "Platform", "Content", "Link", "Date",
+    "All Themes", "Sentiment", "Media Sector Impact", "Collected At"
+]
+
+# Store-only columns (not mirrored to the sheet)
+STORE_COLUMNS = RESULT_COLUMNS + ["Duplicate Of", "Date Imputed", "Theme Source"]
+
+# Display column -> SQL column
+_SQL_COLUMNS = {
+    "Platform": "platform",
+    "Content": "content",
+    "Link": "link",
+    "Date": "date",
+    "All Themes": "all_themes",
+    "Sentiment": "sentiment",
+    "Media Sector Impact": "media_sector_impact",
+    "Collected At": "collected_at",
+    "Duplicate Of": "duplicate_of",
+    "Date Imputed": "date_imputed",
+    "Theme Source": "theme_source",
+}
+
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Zone names the email parser does not know (it would read them as UTC)
+_TZ_ABBREVIATIONS = {"EAT": "+0300", "CAT": "+0200", "WAT": "+0100"}
+
+
+@lru_cache(maxsize=50_000)
+def parse_date(value):
+    """Naive-UTC Timestamp for one raw feed/sheet date string, or None.
+
+    RFC-822 (what most feeds send) goes through the email parser; anything
+    else (ISO 8601, sheet text) through pandas. Cached, since the same
+    strings come back run after run.
+    """
+    if not isinstance(value, str) or not value.strip():
+        return None
+    head, _, zone = value.strip().rpartition(" ")
+    if zone in _TZ_ABBREVIATIONS:
+        value = f"{head} {_TZ_ABBREVIATIONS[zone]}"
+    try:
+        ts = pd.Timestamp(parsedate_to_datetime(value))
+    except (TypeError, ValueError, IndexError):
+        ts = pd.to_datetime(value, errors="coerce", utc=True)
+    if pd.isna(ts):
+        return None
+    return ts.tz_convert("UTC").tz_localize(None) if ts.tzinfo else ts
+
+
+def normalize_dates(values):
+    """Datetime64 Series (naive UTC) from raw dates; each distinct string is parsed once."""
+    values = pd.Series(values)
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values.dt.tz_convert("UTC").dt.tz_localize(None) if values.dt.tz else values
+    parsed = {v: parse_date(v) for v in values.dropna().unique()}
+    return pd.to_datetime(values.map(parsed))
+
+
+class MediaStore:
+    """Article store deduplicated by Link.
+
+    Rows keep the same columns as the Results sheet. :meth:`append` also
+    keeps two derived tables in step: the full-text index over Content
+    (``articles_fts``) and the day/week count rollups (``rollups``). Dates are UTC, stored as
+    sortable ``YYYY-MM-DD HH:MM:SS`` text so range filters use the index;
+    "Date Imputed" marks rows whose feed gave no usable date, and "Theme
+    Source" how the themes were assigned (keyword, ai, filtered, unreviewed).
+    Rows are only ever added, except that :meth:`update_enrichment` can
+    rewrite their themes later; that bumps :meth:`revision`.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._initialized = False
+
+    def _connect(self):
+        if not self._initialized:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30)
+        if not self._initialized:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS articles (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    platform TEXT,
+                    content TEXT,
+                    link TEXT NOT NULL UNIQUE,
+                    date TEXT,
+                    all_themes TEXT,
+                    sentiment TEXT,
+                    media_sector_impact TEXT,
+                    collected_at TEXT,
+                    duplicate_of TEXT,
+                    date_imputed INTEGER,
+                    theme_source TEXT
+                );
+                CREATE INDEX IF NOT EXISTS articles_date ON articles(date);
+                CREATE INDEX IF NOT EXISTS articles_platform ON articles(platform, date);
+                CREATE INDEX IF NOT EXISTS articles_sentiment ON articles(sentiment, date);
+                CREATE INDEX IF NOT EXISTS articles_impact ON articles(media_sector_impact, date);
+            """)
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(articles)")}
+            if "duplicate_of" not in columns:
+                conn.execute("ALTER TABLE articles ADD COLUMN duplicate_of TEXT")
+            if "date_imputed" not in columns:
+                conn.execute("ALTER TABLE articles ADD COLUMN date_imputed INTEGER")
+            if "theme_source" not in columns:
+                conn.execute("ALTER TABLE articles ADD COLUMN theme_source TEXT")
+            # Contentless: the text lives in articles, the index only maps tokens to ids
+            conn.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5("
+                f"content, content='', prefix='2 3 4', tokenize=\"{FTS_TOKENIZE}\")"
+            )
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS rollups (
+                    grain TEXT,
+                    period TEXT,
+                    platform TEXT,
+                    theme TEXT,
+                    sentiment TEXT,
+                    media_sector_impact TEXT,
+                    articles INTEGER,
+                    PRIMARY KEY (grain, period, platform, theme, sentiment, media_sector_impact)
+                );
+                CREATE TABLE IF NOT EXISTS store_meta (
+                    key TEXT PRIMARY KEY,
+                    value TEXT
+                );
+            """)
+            with conn:
+                # First run catches up on rows stored before these tables existed
+                self._sync_search_index(conn)
+                self._sync_rollups(conn)
+            self._initialized = True
+        return conn
+
+    def _sync_search_index(self, conn, chunk_size=5000):
+        """Index Content of every row added since the last indexed id."""
+        last = conn.execute("SELECT rowid FROM articles_fts ORDER BY rowid DESC LIMIT 1").fetchone()
+        last_id = last[0] if last else 0
+        while True:
+            rows = conn.execute(
+                "SELECT id, content FROM articles WHERE id > ? ORDER BY id LIMIT ?", (last_id, chunk_size)
+            ).fetchall()
+            if not rows:
+                return
+            conn.executemany(
+                "INSERT INTO articles_fts(rowid, content) VALUES (?, ?)",
+                ((i, normalize_search_text(c or "")) for i, c in rows),
+            )
+            last_id = rows[-1][0]
+
+    def _sync_rollups(self, conn, chunk_size=50_000):
+        """Add rows stored since the last sync to the rollup counts."""
+        row = conn.execute("SELECT value FROM store_meta WHERE key = 'rollups_last_id'").fetchone()
+        last_id = int(row[0]) if row else 0
+        while True:
+            df = pd.read_sql_query(
+                'SELECT id, platform AS "Platform", date AS "Date", all_themes AS "All Themes", '
+                'sentiment AS "Sentiment", media_sector_impact AS "Media Sector Impact" '
+                "FROM articles WHERE id > ? ORDER BY id LIMIT ?",
+                conn, params=[last_id, chunk_size],
+            )
+            if df.empty:
+                return
+            df["Date"] = pd.to_datetime(df["Date"], format=DATE_FORMAT, errors="coerce")
+            self._add_rollups(conn, build_rollups(df))
+            last_id = int(df["id"].iloc[-1])
+            conn.execute("INSERT OR REPLACE INTO store_meta VALUES ('rollups_last_id', ?)", (str(last_id),))
+
+    @staticmethod
+    def _add_rollups(conn, counts):
+        """Add rollup rows (negative Articles subtract); rows reaching 0 are dropped."""
+        counts = counts.copy()
+        counts["Period"] = counts["Period"].dt.strftime("%Y-%m-%d")
+        conn.executemany(
+            "INSERT INTO rollups VALUES (?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(grain, period, platform, theme, sentiment, media_sector_impact) "
+            "DO UPDATE SET articles = articles + excluded.articles",
+            counts.astype(object).itertuples(index=False, name=None),
+        )
+        conn.execute("DELETE FROM rollups WHERE articles <= 0")
+
+    def append(self, df):
+        """Insert rows whose Link is not stored yet; returns the number inserted."""
+        if df.empty:
+            return 0
+        df = df.reindex(columns=STORE_COLUMNS).copy()
+        # The collector hands over typed UTC dates; sheet imports and
+        # backfills may still carry raw RFC-822/ISO strings
+        df["Date"] = normalize_dates(df["Date"]).dt.strftime(DATE_FORMAT)
+        df = df.astype(object).where(df.notna(), None)
+
+        sql_cols = ", ".join(_SQL_COLUMNS[c] for c in STORE_COLUMNS)
+        placeholders = ", ".join("?" for _ in STORE_COLUMNS)
+        with closing(self._connect()) as conn, conn:
+            before = conn.total_changes
+            conn.executemany(
+                f"INSERT OR IGNORE INTO articles ({sql_cols}) VALUES ({placeholders})",
+                df.itertuples(index=False, name=None),
+            )
+            inserted = conn.total_changes - before
+            self._sync_search_index(conn)
+            self._sync_rollups(conn)
+            return inserted
+
+    def update_enrichment(self, df):
+        """Rewrite "All Themes", "Media Sector Impact" and "Theme Source" by Link.
+
+        Stored near-duplicates of those links ("Duplicate Of") get the same
+        values, as they inherited them in the first place. Rollups move from
+        the old values to the new ones. Returns the number of rows changed.
+        """
+        columns = ["All Themes", "Media Sector Impact", "Theme Source"]
+        if df.empty:
+            return 0
+        updates = df.drop_duplicates("Link").set_index("Link")[columns]
+        links = updates.index.tolist()
+        select = (
+            'SELECT id, link, duplicate_of, platform AS "Platform", date AS "Date", '
+            'all_themes AS "All Themes", sentiment AS "Sentiment", '
+            'media_sector_impact AS "Media Sector Impact" FROM articles'
+        )
+        with closing(self._connect()) as conn, conn:
+            frames = []
+            for i in range(0, len(links), 500):
+                chunk = links[i:i + 500]
+                marks = ", ".join("?" for _ in chunk)
+                frames.append(pd.read_sql_query(
+                    f"{select} WHERE link IN ({marks}) OR duplicate_of IN ({marks})",
+                    conn, params=chunk + chunk,
+                ))
+            old = pd.concat(frames, ignore_index=True).drop_duplicates("id")
+            if old.empty:
+                return 0
+            old["Date"] = pd.to_datetime(old["Date"], format=DATE_FORMAT, errors="coerce")
+            source = old["link"].where(old["link"].isin(updates.index), old["duplicate_of"])
+            new = old.copy()
+            for col in columns:
+                new[col] = source.map(updates[col]).to_numpy()
+
+            changes = new[columns + ["id"]].astype(object).where(new[columns + ["id"]].notna(), None)
+            conn.executemany(
+                "UPDATE articles SET all_themes = ?, media_sector_impact = ?, theme_source = ? WHERE id = ?",
+                changes.itertuples(index=False, name=None),
+            )
+            removed = build_rollups(old)
+            removed["Articles"] = -removed["Articles"]
+            self._add_rollups(conn, pd.concat([removed, build_rollups(new)], ignore_index=True))
+            conn.execute(
+                "INSERT INTO store_meta VALUES ('revision', '1') "
+                "ON CONFLICT(key) DO UPDATE SET value = CAST(value AS INTEGER) + 1"
+            )
+            return len(new)
+
+    def revision(self):
+        """Counter bumped whenever stored rows change (not when rows are added)."""
+        with closing(self._connect()) as conn:
+            row = conn.execute("SELECT value FROM store_meta WHERE key = 'revision'").fetchone()
+        return int(row[0]) if row else 0
+
+    def existing_links(self, links):
+        """Subset of ``links`` already in the store."""
+        links = list(dict.fromkeys(links))
+        found = set()
+        with closing(self._connect()) as conn:
+            for i in range(0, len(links), 500):
+                chunk = links[i:i + 500]
+                rows = conn.execute(
+                    f"SELECT link FROM articles WHERE link IN ({', '.join('?' for _ in chunk)})", chunk
+                ).fetchall()
+                found.update(r[0] for r in rows)
+        return found
+
+    def lookup(self, links, columns=None):
+        """Stored rows for the given links (any order)."""
+        links = list(dict.fromkeys(links))
+        columns = columns or STORE_COLUMNS
+        select = ", ".join(f'{_SQL_COLUMNS[c]} AS "{c}"' for c in columns)
+        frames = []
+        with closing(self._connect()) as conn:
+            for i in range(0, len(links), 500):
+                chunk = links[i:i + 500]
+                frames.append(pd.read_sql_query(
+                    f"SELECT {select} FROM articles WHERE link IN ({', '.join('?' for _ in chunk)})",
+                    conn, params=chunk,
+                ))
+        return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=columns)
+
+    def read(self, platform=None, sentiment=None, theme=None, impact=None,
+             start=None, end=None, columns=None, limit=None, theme_source=None,
+             duplicates=True):
+        """Filtered read, newest first. ``start``/``end`` are inclusive dates.
+
+        ``duplicates=False`` leaves out near-duplicates ("Duplicate Of" set).
+        """
+        where, params = [], []
+        for col, value in (("platform", platform), ("sentiment", sentiment),
+                           ("all_themes", theme), ("media_sector_impact", impact),
+                           ("theme_source", theme_source)):
+            if value is not None:
+                where.append(f"{col} = ?")
+                params.append(value)
+        if not duplicates:
+            where.append("duplicate_of IS NULL")
+        if start is not None:
+            where.append("date >= ?")
+            params.append(pd.Timestamp(start).strftime(DATE_FORMAT))
+        if end is not None:
+            where.append("date < ?")
+            params.append((pd.Timestamp(end).normalize() + pd.Timedelta(days=1)).strftime(DATE_FORMAT))
+
+        columns = columns or RESULT_COLUMNS
+        select = ", ".join(f'{_SQL_COLUMNS[c]} AS "{c}"' for c in columns)
+        sql = f"SELECT {select} FROM articles"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY date DESC, id DESC"
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+
+        with closing(self._connect()) as conn:
+            df = pd.read_sql_query(sql, conn, params=params)
+        if "Date" in df.columns:
+            df["Date"] = pd.to_datetime(df["Date"], format=DATE_FORMAT, errors="coerce")
+        return df
+
+    def search(self, query, start=None, end=None, prefix=True, rank_limit=20_000):
+        """Links matching a full-text query, as a frame of Link and Score.
+
+        ``start``/``end`` are inclusive dates; see build_fts_query for the
+        syntax. Up to ``rank_limit`` matches are ranked best first (Score is
+        FTS5 bm25, higher is better). Broader queries come back most recently
+        collected first with no Score, since scoring every match would cost more than the
+        match itself.
+        """
+        expression = build_fts_query(query, prefix=prefix)
+        if expression is None:
+            return pd.DataFrame({"Link": pd.Series(dtype=object), "Score": pd.Series(dtype=float)})
+        where, params = ["articles_fts MATCH ?"], [expression]
+        if start is not None:
+            where.append("a.date >= ?")
+            params.append(pd.Timestamp(start).strftime(DATE_FORMAT))
+        if end is not None:
+            where.append("a.date < ?")
+            params.append((pd.Timestamp(end).normalize() + pd.Timedelta(days=1)).strftime(DATE_FORMAT))
+        # CROSS JOIN keeps the index lookup first, whatever the date filter
+        joined = f"FROM articles_fts CROSS JOIN articles a ON a.id = articles_fts.rowid WHERE {' AND '.join(where)}"
+
+        with closing(self._connect()) as conn:
+            df = pd.read_sql_query(
+                f'SELECT a.link AS "Link", NULL AS "Score" {joined} ORDER BY articles_fts.rowid DESC',
+                conn, params=params,
+            )
+            if 0 < len(df) <= rank_limit:
+                df = pd.read_sql_query(
+                    f'SELECT a.link AS "Link", -bm25(articles_fts) AS "Score" {joined} ORDER BY bm25(articles_fts)',
+                    conn, params=params,
+                )
+        df["Score"] = df["Score"].astype(float)
+        return df
+
+    def read_rollups(self, grain="day"):
+        """Rollup counts for one grain (ROLLUP_COLUMNS, Period as datetime)."""
+        with closing(self._connect()) as conn:
+            df = pd.read_sql_query(
+                'SELECT grain AS "Grain", period AS "Period", platform AS "Platform", theme AS "Theme", '
+                'sentiment AS "Sentiment", media_sector_impact AS "Media Sector Impact", articles AS "Articles" '
+                "FROM rollups WHERE grain = ? ORDER BY period",
+                conn, params=[grain],
+            )
+        df["Period"] = pd.to_datetime(df["Period"], format="%Y-%m-%d")
+        return df[ROLLUP_COLUMNS]
+
+    def read_since(self, last_id=0):
+        """Rows added after ``last_id`` (all rows for 0); returns (df, new_last_id).
+
+        Columns are RESULT_COLUMNS plus "Date Imputed".
+        """
+        columns = RESULT_COLUMNS + ["Date Imputed"]
+        select = ", ".join(f'{_SQL_COLUMNS[c]} AS "{c}"' for c in columns)
+        with closing(self._connect()) as conn:
+            df = pd.read_sql_query(
+                f"SELECT id, {select} FROM articles WHERE id > ? ORDER BY id", conn, params=[last_id]
+            )
+        if df.empty:
+            return df.drop(columns="id"), last_id
+        new_last_id = int(df["id"].iloc[-1])
+        df = df.drop(columns="id")
+        df["Date"] = pd.to_datetime(df["Date"], format=DATE_FORMAT, errors="coerce")
+        df["Date Imputed"] = df["Date Imputed"].eq(1)
+        return df, new_last_id
+
+    def count(self):
+        with closing(self._connect()) as conn:
+            return conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
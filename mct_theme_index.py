@@ -0,0 +1,58 @@
+# ===============================================
+# 🟣 MCT Media Monitoring — Multi-label Theme Index
+# (per-theme filters and counts over "All Themes")
+# ===============================================
+
+import numpy as np
+import pandas as pd
+
+NO_THEME = "—"
+
+
+def split_themes(value):
+    """Theme labels in one "All Themes" cell, whatever order they were joined in."""
+    if not isinstance(value, str):
+        return set()
+    return {t.strip() for t in value.split(",") if t.strip() and t.strip() != NO_THEME}
+
+
+class ThemeIndex:
+    """Boolean theme membership for every row, built once per data load.
+
+    "All Themes" is categorical, so each distinct combination is parsed once
+    into a row of ``table`` (combination x theme). Rows are then resolved
+    through their category codes, which keeps filters and counts O(rows)
+    however many themes an article carries.
+    """
+
+    def __init__(self, all_themes, known_labels=()):
+        themes = all_themes if isinstance(all_themes.dtype, pd.CategoricalDtype) else all_themes.astype("category")
+        parsed = [split_themes(c) for c in themes.cat.categories]
+        found = set().union(*parsed)
+        self.labels = [l for l in known_labels if l in found] + sorted(found - set(known_labels))
+        position = {label: i for i, label in enumerate(self.labels)}
+
+        # One spare all-False row at the end: code -1 (missing) indexes it
+        self.table = np.zeros((len(parsed) + 1, len(self.labels)), dtype=bool)
+        for row, labels in enumerate(parsed):
+            self.table[row, [position[l] for l in labels]] = True
+        self.codes = themes.cat.codes.to_numpy()
+
+    def rows_matching(self, labels, mode="any"):
+        """Boolean row mask for articles tagged with any/all of ``labels``."""
+        if not labels:
+            return np.ones(len(self.codes), dtype=bool)
+        # Unknown labels match nothing (all-False column)
+        sub = np.column_stack([
+            self.table[:, self.labels.index(l)] if l in self.labels else np.zeros(len(self.table), dtype=bool)
+            for l in labels
+        ])
+        per_combination = sub.all(axis=1) if mode == "all" else sub.any(axis=1)
+        return per_combination[self.codes]
+
+    def counts(self, row_mask=None):
+        """Articles per theme (an article counts once for each of its themes)."""
+        codes = self.codes if row_mask is None else self.codes[row_mask]
+        # Code -1 (missing) wraps around to the spare all-False row
+        per_combination = np.bincount(codes % len(self.table), minlength=len(self.table))
+        return pd.Series(per_combination @ self.table, index=self.labels, dtype="int64")